@@ -1,6 +1,8 @@
+import asyncio
 import contextlib
 import sys
 import os
+import threading
 from collections.abc import AsyncIterator
 from mcp.server.fastmcp import FastMCP
 from starlette.applications import Starlette
@@ -16,11 +18,27 @@ import uvicorn
 # Initialize FastMCP server for MarkItDown (SSE)
 mcp = FastMCP("markitdown")
 
+# A single MarkItDown instance serves every request, so that converters,
+# plugins and the HTTP session are set up once rather than per call
+_markitdown: MarkItDown | None = None
+_markitdown_lock = threading.Lock()
+
 
 @mcp.tool()
 async def convert_to_markdown(uri: str) -> str:
     """Convert a resource described by an http:, https:, file: or data: URI to markdown"""
-    return MarkItDown(enable_plugins=check_plugins_enabled()).convert_uri(uri).markdown
+    # Conversion blocks on file and network I/O, so keep it off the event loop
+    result = await asyncio.to_thread(get_markitdown().convert_uri, uri)
+    return result.markdown
+
+
+def get_markitdown() -> MarkItDown:
+    global _markitdown
+    if _markitdown is None:
+        with _markitdown_lock:
+            if _markitdown is None:
+                _markitdown = MarkItDown(enable_plugins=check_plugins_enabled())
+    return _markitdown
 
 
 def check_plugins_enabled() -> bool:
@@ -3,15 +3,22 @@ import os
 import re
 import sys
 import shutil
+import tempfile
+import threading
 import traceback
 import io
+import hashlib
+from collections import OrderedDict
 from dataclasses import dataclass
+from itertools import chain
 from importlib.metadata import entry_points
-from typing import Any, List, Dict, Optional, Union, BinaryIO
+from typing import Any, List, Dict, Iterable, Optional, Tuple, Union, BinaryIO
 from pathlib import Path
 from urllib.parse import urlparse
 from warnings import warn
 import requests
+import requests.adapters
+import urllib3.util
 import magika
 import charset_normalizer
 import codecs
@@ -37,7 +44,6 @@ from .converters import (
     OutlookMsgConverter,
     ZipConverter,
     EpubConverter,
-    DocumentIntelligenceConverter,
     CsvConverter,
 )
 
@@ -58,10 +64,84 @@ PRIORITY_GENERIC_FILE_FORMAT = (
     10.0  # Near catch-all converters for mimetypes like text/*, etc.
 )
 
+# Connection pooling and retries for the default requests session. Pools are
+# kept per host, so concurrent conversions from the same site reuse connections.
+_HTTP_POOL_CONNECTIONS = 32
+_HTTP_POOL_MAXSIZE = 64
+_HTTP_RETRY = urllib3.util.Retry(
+    total=2,
+    backoff_factor=0.2,
+    status_forcelist=[500, 502, 503, 504],
+    respect_retry_after_header=False,  # Keep the added latency bounded
+    raise_on_status=False,  # Return the last response, so errors surface as before
+)
+
+# Chunk size used when buffering downloads and non-seekable streams
+_READ_CHUNK_SIZE = 1024 * 1024
+
+# Buffered streams larger than this are moved from memory to a temporary file
+_SPOOL_MAX_SIZE = 4 * 1024 * 1024
+
+# Runs of blank lines, collapsed when normalizing converter output
+_BLANK_LINES_RE = re.compile(r"\n{3,}")
+
+# Filename in a Content-Disposition header
+_CONTENT_DISPOSITION_FILENAME_RE = re.compile(r"filename=([^;]+)")
+
+# Number of magika results remembered by each MarkItDown instance
+_MAGIKA_CACHE_SIZE = 1024
+
+# Loading the magika model takes tens of milliseconds, and the model holds no
+# per-document state, so one instance is created on first use and shared
+_magika: Optional[magika.Magika] = None
+_magika_lock = threading.Lock()
+
+
+def _get_magika() -> magika.Magika:
+    global _magika
+    # Only take the lock until the instance exists
+    if _magika is None:
+        with _magika_lock:
+            if _magika is None:
+                _magika = magika.Magika()
+    return _magika
+
 
 _plugins: Union[None, List[Any]] = None  # If None, plugins have not been loaded yet.
 
 
+def _read_chunks(stream: BinaryIO) -> Iterable[bytes]:
+    """
+    Read the stream to its end in _READ_CHUNK_SIZE chunks. Stops at the first
+    empty read, including the None a non-blocking raw stream returns when no
+    data is available.
+    """
+    while True:
+        chunk = stream.read(_READ_CHUNK_SIZE)
+        if not chunk:
+            break
+        yield chunk
+
+
+def _spool(chunks: Iterable[bytes]) -> BinaryIO:
+    """
+    Buffer the chunks into a seekable stream, positioned at the start. Small
+    payloads stay in memory; larger ones are moved to an anonymous temporary
+    file, which is removed when the returned stream is closed.
+    """
+    buffer: BinaryIO = io.BytesIO()
+    in_memory = True
+    for chunk in chunks:
+        buffer.write(chunk)
+        if in_memory and buffer.tell() > _SPOOL_MAX_SIZE:
+            spooled = tempfile.TemporaryFile()
+            spooled.write(buffer.getvalue())
+            buffer = spooled
+            in_memory = False
+    buffer.seek(0)
+    return buffer
+
+
 def _load_plugins() -> Union[None, List[Any]]:
     """Lazy load plugins, exiting early if already loaded."""
     global _plugins
@@ -107,6 +187,13 @@ class MarkItDown:
         requests_session = kwargs.get("requests_session")
         if requests_session is None:
             self._requests_session = requests.Session()
+            adapter = requests.adapters.HTTPAdapter(
+                pool_connections=_HTTP_POOL_CONNECTIONS,
+                pool_maxsize=_HTTP_POOL_MAXSIZE,
+                max_retries=_HTTP_RETRY,
+            )
+            self._requests_session.mount("http://", adapter)
+            self._requests_session.mount("https://", adapter)
             # Signal that we prefer markdown over HTML, etc. if the server supports it.
             # e.g., https://blog.cloudflare.com/markdown-for-agents/
             self._requests_session.headers.update(
@@ -117,7 +204,8 @@ class MarkItDown:
         else:
             self._requests_session = requests_session
 
-        self._magika = magika.Magika()
+        self._magika_cache: OrderedDict[bytes, Any] = OrderedDict()
+        self._magika_cache_lock = threading.Lock()
 
         # TODO - remove these (see enable_builtins)
         self._llm_client: Any = None
@@ -129,6 +217,10 @@ class MarkItDown:
         # Register the converters
         self._converters: List[ConverterRegistration] = []
 
+        # The converters sorted by priority. Computed on first use, and reset
+        # whenever a converter is registered.
+        self._sorted_converters: Optional[Tuple[ConverterRegistration, ...]] = None
+
         if (
             enable_builtins is None or enable_builtins
         ):  # Default to True when not specified
@@ -206,6 +298,9 @@ class MarkItDown:
             # Register Document Intelligence converter at the top of the stack if endpoint is provided
             docintel_endpoint = kwargs.get("docintel_endpoint")
             if docintel_endpoint is not None:
+                # Imported here, as the Azure SDK is slow to import and rarely needed
+                from .converters import DocumentIntelligenceConverter
+
                 docintel_args: Dict[str, Any] = {}
                 docintel_args["endpoint"] = docintel_endpoint
 
@@ -366,22 +461,24 @@ class MarkItDown:
                 assert base_guess is not None  # for mypy
                 base_guess = base_guess.copy_and_update(url=url)
 
-        # Check if we have a seekable stream. If not, load the entire stream into memory.
+        # Check if we have a seekable stream. If not, buffer the entire stream
+        # (in memory, or in a temporary file if it is large).
+        buffer: Optional[BinaryIO] = None
         if not stream.seekable():
-            buffer = io.BytesIO()
-            while True:
-                chunk = stream.read(4096)
-                if not chunk:
-                    break
-                buffer.write(chunk)
-            buffer.seek(0)
+            buffer = _spool(_read_chunks(stream))
             stream = buffer
 
-        # Add guesses based on stream content
-        guesses = self._get_stream_info_guesses(
-            file_stream=stream, base_guess=base_guess or StreamInfo()
-        )
-        return self._convert(file_stream=stream, stream_info_guesses=guesses, **kwargs)
+        try:
+            # Add guesses based on stream content
+            guesses = self._get_stream_info_guesses(
+                file_stream=stream, base_guess=base_guess or StreamInfo()
+            )
+            return self._convert(
+                file_stream=stream, stream_info_guesses=guesses, **kwargs
+            )
+        finally:
+            if buffer is not None:
+                buffer.close()
 
     def convert_url(
         self,
@@ -489,7 +586,9 @@ class MarkItDown:
         filename: Optional[str] = None
         extension: Optional[str] = None
         if "content-disposition" in response.headers:
-            m = re.search(r"filename=([^;]+)", response.headers["content-disposition"])
+            m = _CONTENT_DISPOSITION_FILENAME_RE.search(
+                response.headers["content-disposition"]
+            )
             if m:
                 filename = m.group(1).strip("\"'")
                 _, _extension = os.path.splitext(filename)
@@ -523,17 +622,15 @@ class MarkItDown:
             # Deprecated -- use stream_info
             base_guess = base_guess.copy_and_update(url=url)
 
-        # Read into BytesIO
-        buffer = io.BytesIO()
-        for chunk in response.iter_content(chunk_size=512):
-            buffer.write(chunk)
-        buffer.seek(0)
-
-        # Convert
-        guesses = self._get_stream_info_guesses(
-            file_stream=buffer, base_guess=base_guess
-        )
-        return self._convert(file_stream=buffer, stream_info_guesses=guesses, **kwargs)
+        # Buffer the body (in memory, or in a temporary file if it is large)
+        with _spool(response.iter_content(chunk_size=_READ_CHUNK_SIZE)) as buffer:
+            # Convert
+            guesses = self._get_stream_info_guesses(
+                file_stream=buffer, base_guess=base_guess
+            )
+            return self._convert(
+                file_stream=buffer, stream_info_guesses=guesses, **kwargs
+            )
 
     def _convert(
         self, *, file_stream: BinaryIO, stream_info_guesses: List[StreamInfo], **kwargs
@@ -543,50 +640,59 @@ class MarkItDown:
         # Keep track of which converters throw exceptions
         failed_attempts: List[FailedConversionAttempt] = []
 
-        # Create a copy of the page_converters list, sorted by priority.
-        # We do this with each call to _convert because the priority of converters may change between calls.
+        # Sort the converters by priority, caching the result until the next registration.
         # The sort is guaranteed to be stable, so converters with the same priority will remain in the same order.
-        sorted_registrations = sorted(self._converters, key=lambda x: x.priority)
+        sorted_registrations = self._sorted_converters
+        if sorted_registrations is None:
+            sorted_registrations = tuple(
+                sorted(self._converters, key=lambda x: x.priority)
+            )
+            self._sorted_converters = sorted_registrations
 
         # Remember the initial stream position so that we can return to it
         cur_pos = file_stream.tell()
 
-        for stream_info in stream_info_guesses + [StreamInfo()]:
-            for converter_registration in sorted_registrations:
-                converter = converter_registration.converter
-                # Sanity check -- make sure the cur_pos is still the same
-                assert (
-                    cur_pos == file_stream.tell()
-                ), "File stream position should NOT change between guess iterations"
+        # Options shared by every attempt. Converters receive them as **kwargs,
+        # so each call gets its own dict and cannot affect the others.
+        base_kwargs = dict(kwargs)
 
-                _kwargs = {k: v for k, v in kwargs.items()}
+        # Copy any additional global options
+        if "llm_client" not in base_kwargs and self._llm_client is not None:
+            base_kwargs["llm_client"] = self._llm_client
+
+        if "llm_model" not in base_kwargs and self._llm_model is not None:
+            base_kwargs["llm_model"] = self._llm_model
 
-                # Copy any additional global options
-                if "llm_client" not in _kwargs and self._llm_client is not None:
-                    _kwargs["llm_client"] = self._llm_client
+        if "llm_prompt" not in base_kwargs and self._llm_prompt is not None:
+            base_kwargs["llm_prompt"] = self._llm_prompt
 
-                if "llm_model" not in _kwargs and self._llm_model is not None:
-                    _kwargs["llm_model"] = self._llm_model
+        if "style_map" not in base_kwargs and self._style_map is not None:
+            base_kwargs["style_map"] = self._style_map
 
-                if "llm_prompt" not in _kwargs and self._llm_prompt is not None:
-                    _kwargs["llm_prompt"] = self._llm_prompt
+        if "exiftool_path" not in base_kwargs and self._exiftool_path is not None:
+            base_kwargs["exiftool_path"] = self._exiftool_path
 
-                if "style_map" not in _kwargs and self._style_map is not None:
-                    _kwargs["style_map"] = self._style_map
+        # Add the list of converters for nested processing
+        base_kwargs["_parent_converters"] = self._converters
 
-                if "exiftool_path" not in _kwargs and self._exiftool_path is not None:
-                    _kwargs["exiftool_path"] = self._exiftool_path
+        # Try each distinct guess once, in order. When nothing is known about the
+        # stream, the only guess is itself an empty StreamInfo.
+        for stream_info in dict.fromkeys(chain(stream_info_guesses, (StreamInfo(),))):
+            _kwargs = dict(base_kwargs)
 
-                # Add the list of converters for nested processing
-                _kwargs["_parent_converters"] = self._converters
+            # Add legaxy kwargs
+            if stream_info.extension is not None:
+                _kwargs["file_extension"] = stream_info.extension
 
-                # Add legaxy kwargs
-                if stream_info is not None:
-                    if stream_info.extension is not None:
-                        _kwargs["file_extension"] = stream_info.extension
+            if stream_info.url is not None:
+                _kwargs["url"] = stream_info.url
 
-                    if stream_info.url is not None:
-                        _kwargs["url"] = stream_info.url
+            for converter_registration in sorted_registrations:
+                converter = converter_registration.converter
+                # Sanity check -- make sure the cur_pos is still the same
+                assert (
+                    cur_pos == file_stream.tell()
+                ), "File stream position should NOT change between guess iterations"
 
                 # Check if the converter will accept the file, and if so, try to convert it
                 _accepts = False
@@ -615,10 +721,13 @@ class MarkItDown:
 
                 if res is not None:
                     # Normalize the content
-                    res.text_content = "\n".join(
-                        [line.rstrip() for line in re.split(r"\r?\n", res.text_content)]
-                    )
-                    res.text_content = re.sub(r"\n{3,}", "\n\n", res.text_content)
+                    lines = res.text_content.replace("\r\n", "\n").split("\n")
+                    text_content = "\n".join([line.rstrip() for line in lines])
+                    # Most output has no blank-line runs; a substring check is
+                    # far cheaper than a regex pass that makes no substitutions
+                    if "\n\n\n" in text_content:
+                        text_content = _BLANK_LINES_RE.sub("\n\n", text_content)
+                    res.text_content = text_content
                     return res
 
         # If we got this far without success, report any exceptions
@@ -669,6 +778,7 @@ class MarkItDown:
         self._converters.insert(
             0, ConverterRegistration(converter=converter, priority=priority)
         )
+        self._sorted_converters = None
 
     def _get_stream_info_guesses(
         self, file_stream: BinaryIO, base_guess: StreamInfo
@@ -698,11 +808,13 @@ class MarkItDown:
         # Call magika to guess from the stream
         cur_pos = file_stream.tell()
         try:
-            result = self._magika.identify_stream(file_stream)
-            if result.status == "ok" and result.prediction.output.label != "unknown":
+            result = self._identify_stream(file_stream)
+            # Resolve the prediction once; the attribute chain is otherwise walked for every field below
+            output = result.prediction.output if result.status == "ok" else None
+            if output is not None and output.label != "unknown":
                 # If it's text, also guess the charset
                 charset = None
-                if result.prediction.output.is_text:
+                if output.is_text:
                     # Read the first 4k to guess the charset
                     file_stream.seek(cur_pos)
                     stream_page = file_stream.read(4096)
@@ -713,21 +825,20 @@ class MarkItDown:
 
                 # Normalize the first extension listed
                 guessed_extension = None
-                if len(result.prediction.output.extensions) > 0:
-                    guessed_extension = "." + result.prediction.output.extensions[0]
+                if len(output.extensions) > 0:
+                    guessed_extension = "." + output.extensions[0]
 
                 # Determine if the guess is compatible with the base guess
                 compatible = True
                 if (
                     base_guess.mimetype is not None
-                    and base_guess.mimetype != result.prediction.output.mime_type
+                    and base_guess.mimetype != output.mime_type
                 ):
                     compatible = False
 
                 if (
                     base_guess.extension is not None
-                    and base_guess.extension.lstrip(".")
-                    not in result.prediction.output.extensions
+                    and base_guess.extension.lstrip(".") not in output.extensions
                 ):
                     compatible = False
 
@@ -741,8 +852,7 @@ class MarkItDown:
                     # Add the compatible base guess
                     guesses.append(
                         StreamInfo(
-                            mimetype=base_guess.mimetype
-                            or result.prediction.output.mime_type,
+                            mimetype=base_guess.mimetype or output.mime_type,
                             extension=base_guess.extension or guessed_extension,
                             charset=base_guess.charset or charset,
                             filename=base_guess.filename,
@@ -755,7 +865,7 @@ class MarkItDown:
                     guesses.append(enhanced_guess)
                     guesses.append(
                         StreamInfo(
-                            mimetype=result.prediction.output.mime_type,
+                            mimetype=output.mime_type,
                             extension=guessed_extension,
                             charset=charset,
                             filename=base_guess.filename,
@@ -771,6 +881,45 @@ class MarkItDown:
 
         return guesses
 
+    def _identify_stream(self, file_stream: BinaryIO) -> Any:
+        """
+        Identify the stream with magika, caching the results. Magika only looks at
+        the size of the stream and at (at most) block_size bytes from each end, so a
+        digest of these identifies its input exactly.
+        """
+        identifier = _get_magika()
+        block_size = getattr(
+            getattr(identifier, "_model_config", None), "block_size", None
+        )
+        if not isinstance(block_size, int):
+            return identifier.identify_stream(file_stream)
+
+        cur_pos = file_stream.tell()
+        try:
+            size = file_stream.seek(0, os.SEEK_END)
+            file_stream.seek(0)
+            digest = hashlib.blake2b(size.to_bytes(8, "little"), digest_size=16)
+            digest.update(file_stream.read(block_size))
+            file_stream.seek(max(0, size - block_size))
+            digest.update(file_stream.read(block_size))
+        finally:
+            file_stream.seek(cur_pos)
+        key = digest.digest()
+
+        with self._magika_cache_lock:
+            result = self._magika_cache.get(key)
+            if result is not None:
+                self._magika_cache.move_to_end(key)
+                return result
+
+        result = identifier.identify_stream(file_stream)
+        if result.status == "ok":
+            with self._magika_cache_lock:
+                self._magika_cache[key] = result
+                if len(self._magika_cache) > _MAGIKA_CACHE_SIZE:
+                    self._magika_cache.popitem(last=False)
+        return result
+
     def _normalize_charset(self, charset: str | None) -> str | None:
         """
         Normalize a charset string to a canonical form.
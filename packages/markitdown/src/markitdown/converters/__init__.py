@@ -2,6 +2,9 @@
 #
 # SPDX-License-Identifier: MIT
 
+import importlib
+from typing import Any
+
 from ._plain_text_converter import PlainTextConverter
 from ._html_converter import HtmlConverter
 from ._rss_converter import RssConverter
@@ -17,10 +20,6 @@ from ._image_converter import ImageConverter
 from ._audio_converter import AudioConverter
 from ._outlook_msg_converter import OutlookMsgConverter
 from ._zip_converter import ZipConverter
-from ._doc_intel_converter import (
-    DocumentIntelligenceConverter,
-    DocumentIntelligenceFileType,
-)
 from ._epub_converter import EpubConverter
 from ._csv_converter import CsvConverter
 
@@ -46,3 +45,17 @@ __all__ = [
     "EpubConverter",
     "CsvConverter",
 ]
+
+# Converters whose dependencies are slow to import, and which are only needed
+# when explicitly configured. They are imported on first access.
+_LAZY_IMPORTS = {
+    "DocumentIntelligenceConverter": "._doc_intel_converter",
+    "DocumentIntelligenceFileType": "._doc_intel_converter",
+}
+
+
+def __getattr__(name: str) -> Any:
+    if name in _LAZY_IMPORTS:
+        module = importlib.import_module(_LAZY_IMPORTS[name], __name__)
+        return getattr(module, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
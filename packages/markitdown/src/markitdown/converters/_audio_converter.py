@@ -20,6 +20,25 @@ ACCEPTED_FILE_EXTENSIONS = [
 ]
 
 
+# Metadata fields to report, in order
+METADATA_FIELDS = [
+    "Title",
+    "Artist",
+    "Author",
+    "Band",
+    "Album",
+    "Genre",
+    "Track",
+    "DateTimeOriginal",
+    "CreateDate",
+    # "Duration", -- Wrong values when read from memory
+    "NumChannels",
+    "SampleRate",
+    "AvgBytesPerSec",
+    "BitsPerSample",
+]
+
+
 class AudioConverter(DocumentConverter):
     """
     Converts audio files to markdown via extraction of metadata (if `exiftool` is installed), and speech transcription (if `speech_recognition` is installed).
@@ -56,24 +75,9 @@ class AudioConverter(DocumentConverter):
             file_stream, exiftool_path=kwargs.get("exiftool_path")
         )
         if metadata:
-            for f in [
-                "Title",
-                "Artist",
-                "Author",
-                "Band",
-                "Album",
-                "Genre",
-                "Track",
-                "DateTimeOriginal",
-                "CreateDate",
-                # "Duration", -- Wrong values when read from memory
-                "NumChannels",
-                "SampleRate",
-                "AvgBytesPerSec",
-                "BitsPerSample",
-            ]:
-                if f in metadata:
-                    md_content += f"{f}: {metadata[f]}\n"
+            md_content += "".join(
+                f"{f}: {metadata[f]}\n" for f in METADATA_FIELDS if f in metadata
+            )
 
         # Figure out the audio format for transcription
         if stream_info.extension == ".wav" or stream_info.mimetype == "audio/x-wav":
@@ -91,7 +95,12 @@ class AudioConverter(DocumentConverter):
         # Transcribe
         if audio_format:
             try:
-                transcript = transcribe_audio(file_stream, audio_format=audio_format)
+                transcript = transcribe_audio(
+                    file_stream,
+                    audio_format=audio_format,
+                    backend=kwargs.get("audio_transcription_backend"),
+                    whisper_model=kwargs.get("whisper_model"),
+                )
                 if transcript:
                     md_content += "\n\n### Audio Transcript:\n" + transcript
             except MissingDependencyException:
@@ -7,7 +7,8 @@ from bs4 import BeautifulSoup
 
 from .._base_converter import DocumentConverter, DocumentConverterResult
 from .._stream_info import StreamInfo
-from ._markdownify import _CustomMarkdownify
+from ._html_converter import _HTML_PARSER
+from ._markdownify import get_markdownify
 
 ACCEPTED_MIME_TYPE_PREFIXES = [
     "text/html",
@@ -19,6 +20,8 @@ ACCEPTED_FILE_EXTENSIONS = [
     ".htm",
 ]
 
+_BING_URL_RE = re.compile(r"^https://www\.bing\.com/search\?q=")
+
 
 class BingSerpConverter(DocumentConverter):
     """
@@ -40,7 +43,7 @@ class BingSerpConverter(DocumentConverter):
         mimetype = (stream_info.mimetype or "").lower()
         extension = (stream_info.extension or "").lower()
 
-        if not re.search(r"^https://www\.bing\.com/search\?q=", url):
+        if not _BING_URL_RE.search(url):
             # Not a Bing SERP URL
             return False
 
@@ -68,24 +71,41 @@ class BingSerpConverter(DocumentConverter):
 
         # Parse the stream
         encoding = "utf-8" if stream_info.charset is None else stream_info.charset
-        soup = BeautifulSoup(file_stream, "html.parser", from_encoding=encoding)
+        soup = BeautifulSoup(file_stream, _HTML_PARSER, from_encoding=encoding)
+
+        # Collect everything of interest in a single traversal
+        tptts = []
+        slugs = []
+        algos = []
+        for elm in soup.find_all(class_=["tptt", "algoSlug_icon", "b_algo"]):
+            classes = elm.get("class") or []
+            if "tptt" in classes:
+                tptts.append(elm)
+            if "algoSlug_icon" in classes:
+                slugs.append(elm)
+            if "b_algo" in classes:
+                algos.append(elm)
 
         # Clean up some formatting
-        for tptt in soup.find_all(class_="tptt"):
+        for tptt in tptts:
             if hasattr(tptt, "string") and tptt.string:
                 tptt.string += " "
-        for slug in soup.find_all(class_="algoSlug_icon"):
+        for slug in slugs:
             slug.extract()
 
         # Parse the algorithmic results
-        _markdownify = _CustomMarkdownify(**kwargs)
+        _markdownify = get_markdownify(**kwargs)
         results = list()
-        for result in soup.find_all(class_="b_algo"):
+        for result in algos:
             if not hasattr(result, "find_all"):
                 continue
 
             # Rewrite redirect urls
             for a in result.find_all("a", href=True):
+                # Most links are not redirects; skip them without parsing
+                if "u=" not in a["href"]:
+                    continue
+
                 parsed_href = urlparse(a["href"])
                 qs = parse_qs(parsed_href.query)
 
@@ -98,16 +118,14 @@ class BingSerpConverter(DocumentConverter):
 
                     try:
                         # RFC 4648 / Base64URL" variant, which uses "-" and "_"
-                        a["href"] = base64.b64decode(u, altchars="-_").decode("utf-8")
-                    except UnicodeDecodeError:
-                        pass
-                    except binascii.Error:
+                        a["href"] = base64.urlsafe_b64decode(u).decode("utf-8")
+                    except (UnicodeDecodeError, binascii.Error):
                         pass
 
             # Convert to markdown
             md_result = _markdownify.convert_soup(result).strip()
-            lines = [line.strip() for line in re.split(r"\n+", md_result)]
-            results.append("\n".join([line for line in lines if len(line) > 0]))
+            lines = (line.strip() for line in md_result.split("\n"))
+            results.append("\n".join([line for line in lines if line]))
 
         webpage_text = (
             f"## A Bing search for '{query}' found the following results:\n\n"
@@ -1,6 +1,7 @@
 import sys
 import re
 import os
+import threading
 from typing import BinaryIO, Any, List
 from enum import Enum
 
@@ -14,7 +15,6 @@ _dependency_exc_info = None
 try:
     from azure.ai.documentintelligence import DocumentIntelligenceClient
     from azure.ai.documentintelligence.models import (
-        AnalyzeDocumentRequest,
         AnalyzeResult,
         DocumentAnalysisFeature,
     )
@@ -34,9 +34,6 @@ except ImportError:
     class DocumentIntelligenceClient:
         pass
 
-    class AnalyzeDocumentRequest:
-        pass
-
     class AnalyzeResult:
         pass
 
@@ -51,6 +48,23 @@ except ImportError:
 # This constant is a temporary fix until the bug is resolved.
 CONTENT_FORMAT = "markdown"
 
+# HTML comments (e.g., page markers) that Document Intelligence embeds in its Markdown
+_HTML_COMMENT_RE = re.compile(r"<!--.*?-->", re.DOTALL)
+
+# DefaultAzureCredential probes a chain of credential sources (environment, managed
+# identity, Azure CLI, ...) and caches the tokens it obtains, so one is shared by
+# all converter instances
+_default_credential: DefaultAzureCredential | None = None
+_default_credential_lock = threading.Lock()
+
+
+def _get_default_credential() -> DefaultAzureCredential:
+    global _default_credential
+    with _default_credential_lock:
+        if _default_credential is None:
+            _default_credential = DefaultAzureCredential()
+        return _default_credential
+
 
 class DocumentIntelligenceFileType(str, Enum):
     """Enum of file types supported by the Document Intelligence Converter."""
@@ -174,7 +188,7 @@ class DocumentIntelligenceConverter(DocumentConverter):
 
         if credential is None:
             if os.environ.get("AZURE_API_KEY") is None:
-                credential = DefaultAzureCredential()
+                credential = _get_default_credential()
             else:
                 credential = AzureKeyCredential(os.environ["AZURE_API_KEY"])
 
@@ -240,15 +254,17 @@ class DocumentIntelligenceConverter(DocumentConverter):
         stream_info: StreamInfo,
         **kwargs: Any,  # Options to pass to the converter
     ) -> DocumentConverterResult:
-        # Extract the text using Azure Document Intelligence
+        # Extract the text using Azure Document Intelligence. The document is sent
+        # as the raw request body (application/octet-stream), rather than wrapped in
+        # an AnalyzeDocumentRequest, which would base64-encode it into a JSON payload.
         poller = self.doc_intel_client.begin_analyze_document(
             model_id="prebuilt-layout",
-            body=AnalyzeDocumentRequest(bytes_source=file_stream.read()),
+            body=file_stream.read(),
             features=self._analysis_features(stream_info),
             output_content_format=CONTENT_FORMAT,  # TODO: replace with "ContentFormat.MARKDOWN" when the bug is fixed
         )
         result: AnalyzeResult = poller.result()
 
         # remove comments from the markdown content generated by Doc Intelligence and append to markdown string
-        markdown_text = re.sub(r"<!--.*?-->", "", result.content, flags=re.DOTALL)
+        markdown_text = _HTML_COMMENT_RE.sub("", result.content)
         return DocumentConverterResult(markdown=markdown_text)
@@ -1,5 +1,5 @@
+import functools
 import json
-import locale
 import subprocess
 from typing import Any, BinaryIO, Union
 
@@ -8,16 +8,12 @@ def _parse_version(version: str) -> tuple:
     return tuple(map(int, (version.split("."))))
 
 
-def exiftool_metadata(
-    file_stream: BinaryIO,
-    *,
-    exiftool_path: Union[str, None],
-) -> Any:  # Need a better type for json data
-    # Nothing to do
-    if not exiftool_path:
-        return {}
-
-    # Verify exiftool version
+@functools.lru_cache(maxsize=None)
+def _verify_exiftool_version(exiftool_path: str) -> None:
+    """
+    Check that the exiftool at the given path is not vulnerable to CVE-2021-22204.
+    Successful checks are cached, so the version is only queried once per path.
+    """
     try:
         version_output = subprocess.run(
             [exiftool_path, "-ver"],
@@ -35,6 +31,19 @@ def exiftool_metadata(
     except (subprocess.CalledProcessError, ValueError) as e:
         raise RuntimeError("Failed to verify ExifTool version.") from e
 
+
+def exiftool_metadata(
+    file_stream: BinaryIO,
+    *,
+    exiftool_path: Union[str, None],
+) -> Any:  # Need a better type for json data
+    # Nothing to do
+    if not exiftool_path:
+        return {}
+
+    # Verify exiftool version
+    _verify_exiftool_version(exiftool_path)
+
     # Run exiftool
     cur_pos = file_stream.tell()
     try:
@@ -45,8 +54,7 @@ def exiftool_metadata(
             text=False,
         ).stdout
 
-        return json.loads(
-            output.decode(locale.getpreferredencoding(False)),
-        )[0]
+        # exiftool emits its JSON as UTF-8, which json.loads detects on its own
+        return json.loads(output)[0]
     finally:
         file_stream.seek(cur_pos)
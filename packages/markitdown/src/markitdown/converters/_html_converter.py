@@ -1,11 +1,11 @@
-import io
 import warnings
 from typing import Any, BinaryIO, Optional
 from bs4 import BeautifulSoup
+from bs4.builder import builder_registry
 
 from .._base_converter import DocumentConverter, DocumentConverterResult
 from .._stream_info import StreamInfo
-from ._markdownify import _CustomMarkdownify
+from ._markdownify import get_markdownify
 
 ACCEPTED_MIME_TYPE_PREFIXES = [
     "text/html",
@@ -17,6 +17,9 @@ ACCEPTED_FILE_EXTENSIONS = [
     ".htm",
 ]
 
+# Prefer the (much faster) lxml parser when it is installed
+_HTML_PARSER = "lxml" if builder_registry.lookup("lxml") else "html.parser"
+
 
 class HtmlConverter(DocumentConverter):
     """Anything with content type text/html"""
@@ -44,15 +47,19 @@ class HtmlConverter(DocumentConverter):
         file_stream: BinaryIO,
         stream_info: StreamInfo,
         **kwargs: Any,  # Options to pass to the converter
+    ) -> DocumentConverterResult:
+        # Parse the stream
+        encoding = "utf-8" if stream_info.charset is None else stream_info.charset
+        soup = BeautifulSoup(file_stream, _HTML_PARSER, from_encoding=encoding)
+        return self._convert_soup(soup, stream_info, **kwargs)
+
+    def _convert_soup(
+        self, soup: BeautifulSoup, stream_info: StreamInfo, **kwargs: Any
     ) -> DocumentConverterResult:
         # Pop our own keyword before forwarding the rest to markdownify.
         # strict=True raises RecursionError instead of falling back to plain text.
         strict: bool = kwargs.pop("strict", False)
 
-        # Parse the stream
-        encoding = "utf-8" if stream_info.charset is None else stream_info.charset
-        soup = BeautifulSoup(file_stream, "html.parser", from_encoding=encoding)
-
         # Remove javascript and style blocks
         for script in soup(["script", "style"]):
             script.extract()
@@ -62,9 +69,9 @@ class HtmlConverter(DocumentConverter):
         webpage_text = ""
         try:
             if body_elm:
-                webpage_text = _CustomMarkdownify(**kwargs).convert_soup(body_elm)
+                webpage_text = get_markdownify(**kwargs).convert_soup(body_elm)
             else:
-                webpage_text = _CustomMarkdownify(**kwargs).convert_soup(soup)
+                webpage_text = get_markdownify(**kwargs).convert_soup(soup)
         except RecursionError:
             if strict:
                 raise
@@ -98,9 +105,10 @@ class HtmlConverter(DocumentConverter):
         Given that many converters produce HTML as intermediate output, this
         allows for easy conversion of HTML to markdown.
         """
-        return self.convert(
-            file_stream=io.BytesIO(html_content.encode("utf-8")),
-            stream_info=StreamInfo(
+        # Parse the string as-is, rather than round-tripping through bytes
+        return self._convert_soup(
+            BeautifulSoup(html_content, _HTML_PARSER),
+            StreamInfo(
                 mimetype="text/html",
                 extension=".html",
                 charset="utf-8",
@@ -1,7 +1,6 @@
-from typing import BinaryIO, Any, Union
-import base64
-import mimetypes
+from typing import BinaryIO, Any
 from ._exiftool import exiftool_metadata
+from ._llm_caption import llm_caption
 from .._base_converter import DocumentConverter, DocumentConverterResult
 from .._stream_info import StreamInfo
 
@@ -12,6 +11,27 @@ ACCEPTED_MIME_TYPE_PREFIXES = [
 
 ACCEPTED_FILE_EXTENSIONS = [".jpg", ".jpeg", ".png"]
 
+# Leading bytes of the supported image formats
+_IMAGE_SIGNATURES = (
+    b"\xff\xd8\xff",  # JPEG
+    b"\x89PNG\r\n\x1a\n",  # PNG
+)
+
+
+# Metadata fields to report, in order
+METADATA_FIELDS = [
+    "ImageSize",
+    "Title",
+    "Caption",
+    "Description",
+    "Keywords",
+    "Artist",
+    "Author",
+    "DateTimeOriginal",
+    "CreateDate",
+    "GPSPosition",
+]
+
 
 class ImageConverter(DocumentConverter):
     """
@@ -28,14 +48,26 @@ class ImageConverter(DocumentConverter):
         extension = (stream_info.extension or "").lower()
 
         if extension in ACCEPTED_FILE_EXTENSIONS:
-            return True
+            return self._has_image_signature(file_stream)
 
         for prefix in ACCEPTED_MIME_TYPE_PREFIXES:
             if mimetype.startswith(prefix):
-                return True
+                return self._has_image_signature(file_stream)
 
         return False
 
+    def _has_image_signature(self, file_stream: BinaryIO) -> bool:
+        """
+        Check the leading bytes, so that files whose extension or mimetype lies
+        don't cost an exiftool run or an LLM upload.
+        """
+        cur_pos = file_stream.tell()
+        try:
+            header = file_stream.read(8)
+        finally:
+            file_stream.seek(cur_pos)
+        return header.startswith(_IMAGE_SIGNATURES)
+
     def convert(
         self,
         file_stream: BinaryIO,
@@ -50,26 +82,15 @@ class ImageConverter(DocumentConverter):
         )
 
         if metadata:
-            for f in [
-                "ImageSize",
-                "Title",
-                "Caption",
-                "Description",
-                "Keywords",
-                "Artist",
-                "Author",
-                "DateTimeOriginal",
-                "CreateDate",
-                "GPSPosition",
-            ]:
-                if f in metadata:
-                    md_content += f"{f}: {metadata[f]}\n"
+            md_content += "".join(
+                f"{f}: {metadata[f]}\n" for f in METADATA_FIELDS if f in metadata
+            )
 
         # Try describing the image with GPT
         llm_client = kwargs.get("llm_client")
         llm_model = kwargs.get("llm_model")
         if llm_client is not None and llm_model is not None:
-            llm_description = self._get_llm_description(
+            llm_description = llm_caption(
                 file_stream,
                 stream_info,
                 client=llm_client,
@@ -83,56 +104,3 @@ class ImageConverter(DocumentConverter):
         return DocumentConverterResult(
             markdown=md_content,
         )
-
-    def _get_llm_description(
-        self,
-        file_stream: BinaryIO,
-        stream_info: StreamInfo,
-        *,
-        client,
-        model,
-        prompt=None,
-    ) -> Union[None, str]:
-        if prompt is None or prompt.strip() == "":
-            prompt = "Write a detailed caption for this image."
-
-        # Get the content type
-        content_type = stream_info.mimetype
-        if not content_type:
-            content_type, _ = mimetypes.guess_type(
-                "_dummy" + (stream_info.extension or "")
-            )
-        if not content_type:
-            content_type = "application/octet-stream"
-
-        # Convert to base64
-        cur_pos = file_stream.tell()
-        try:
-            base64_image = base64.b64encode(file_stream.read()).decode("utf-8")
-        except Exception as e:
-            return None
-        finally:
-            file_stream.seek(cur_pos)
-
-        # Prepare the data-uri
-        data_uri = f"data:{content_type};base64,{base64_image}"
-
-        # Prepare the OpenAI API request
-        messages = [
-            {
-                "role": "user",
-                "content": [
-                    {"type": "text", "text": prompt},
-                    {
-                        "type": "image_url",
-                        "image_url": {
-                            "url": data_uri,
-                        },
-                    },
-                ],
-            }
-        ]
-
-        # Call the OpenAI API
-        response = client.chat.completions.create(model=model, messages=messages)
-        return response.choices[0].message.content
@@ -1,16 +1,27 @@
 from typing import BinaryIO, Any
+import codecs
 import json
+import re
 
 from .._base_converter import DocumentConverter, DocumentConverterResult
 from .._exceptions import FileConversionException
 from .._stream_info import StreamInfo
 
+# orjson is an optional accelerator; fall back to the standard library
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 CANDIDATE_MIME_TYPE_PREFIXES = [
     "application/json",
 ]
 
 ACCEPTED_FILE_EXTENSIONS = [".ipynb"]
 
+# First level-1 heading in a markdown cell
+_TITLE_RE = re.compile(r"^# .*", re.MULTILINE)
+
 
 class IpynbConverter(DocumentConverter):
     """Converts Jupyter Notebook (.ipynb) files to Markdown."""
@@ -49,30 +60,50 @@ class IpynbConverter(DocumentConverter):
         stream_info: StreamInfo,
         **kwargs: Any,  # Options to pass to the converter
     ) -> DocumentConverterResult:
-        # Parse and convert the notebook
+        # Parse and convert the notebook. The raw text is not kept around, so
+        # that it can be freed before the cells are walked.
         encoding = stream_info.charset or "utf-8"
-        notebook_content = file_stream.read().decode(encoding=encoding)
-        return self._convert(json.loads(notebook_content))
+        return self._convert(self._load_json(file_stream.read(), encoding))
+
+    def _load_json(self, data: bytes, encoding: str) -> Any:
+        """Parse the notebook JSON, using orjson when it is installed."""
+        if orjson is not None:
+            try:
+                # orjson reads UTF-8 bytes directly, skipping the decode
+                if codecs.lookup(encoding).name == "utf-8":
+                    return orjson.loads(data)
+                return orjson.loads(data.decode(encoding))
+            except orjson.JSONDecodeError:
+                # orjson is strict (e.g., no NaN, no 64+ bit integers), while
+                # notebooks written by Python's json module may not be
+                pass
+        return json.loads(data.decode(encoding=encoding))
 
     def _convert(self, notebook_content: dict) -> DocumentConverterResult:
         """Helper function that converts notebook JSON content to Markdown."""
         try:
             md_output = []
-            title = None
+
+            # A title in the notebook metadata takes precedence, in which case
+            # the markdown cells need not be scanned for a heading
+            metadata = notebook_content.get("metadata", {})
+            title = metadata.get("title")
+            find_title = "title" not in metadata
 
             for cell in notebook_content.get("cells", []):
                 cell_type = cell.get("cell_type", "")
                 source_lines = cell.get("source", [])
 
                 if cell_type == "markdown":
-                    md_output.append("".join(source_lines))
+                    cell_text = "".join(source_lines)
+                    md_output.append(cell_text)
 
                     # Extract the first # heading as title if not already found
-                    if title is None:
-                        for line in source_lines:
-                            if line.startswith("# "):
-                                title = line.lstrip("# ").strip()
-                                break
+                    if find_title:
+                        match = _TITLE_RE.search(cell_text)
+                        if match:
+                            title = match.group(0).lstrip("# ").strip()
+                            find_title = False
 
                 elif cell_type == "code":
                     # Code cells are wrapped in Markdown code blocks
@@ -82,9 +113,6 @@ class IpynbConverter(DocumentConverter):
 
             md_text = "\n\n".join(md_output)
 
-            # Check for title in notebook metadata
-            title = notebook_content.get("metadata", {}).get("title", title)
-
             return DocumentConverterResult(
                 markdown=md_text,
                 title=title,
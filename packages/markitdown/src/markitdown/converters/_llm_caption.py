@@ -1,8 +1,24 @@
-from typing import BinaryIO, Union
+from typing import Any, BinaryIO, Union
 import base64
+import hashlib
 import mimetypes
+import threading
+import weakref
+from collections import OrderedDict
+from concurrent.futures import Future
 from .._stream_info import StreamInfo
 
+# Captions of recently seen images, so that a logo repeated across the slides
+# of a deck or the files of a ZIP is only sent to the LLM once. Entries are
+# Futures, so concurrent requests for the same image wait on the first one.
+# Each client gets its own cache, held weakly so that it doesn't keep the
+# client (and its HTTP session) alive.
+_CAPTION_CACHE_SIZE = 1024
+_caption_caches: "weakref.WeakKeyDictionary[Any, OrderedDict[tuple, Future]]" = (
+    weakref.WeakKeyDictionary()
+)
+_caption_cache_lock = threading.Lock()
+
 
 def llm_caption(
     file_stream: BinaryIO, stream_info: StreamInfo, *, client, model, prompt=None
@@ -17,17 +33,61 @@ def llm_caption(
     if not content_type:
         content_type = "application/octet-stream"
 
-    # Convert to base64
     cur_pos = file_stream.tell()
     try:
-        base64_image = base64.b64encode(file_stream.read()).decode("utf-8")
+        image_bytes = file_stream.read()
     except Exception as e:
         return None
     finally:
         file_stream.seek(cur_pos)
 
-    # Prepare the data-uri
-    data_uri = f"data:{content_type};base64,{base64_image}"
+    key = (
+        model,
+        prompt,
+        content_type,
+        hashlib.blake2b(image_bytes, digest_size=16).digest(),
+    )
+    pending: Future = Future()
+    try:
+        with _caption_cache_lock:
+            caption_cache = _caption_caches.get(client)
+            if caption_cache is None:
+                caption_cache = _caption_caches[client] = OrderedDict()
+            cached = caption_cache.get(key)
+            if cached is not None:
+                caption_cache.move_to_end(key)
+            else:
+                caption_cache[key] = pending
+                if len(caption_cache) > _CAPTION_CACHE_SIZE:
+                    caption_cache.popitem(last=False)
+    except TypeError:
+        # Unhashable or not weak-referenceable client; don't cache
+        return _request_caption(image_bytes, content_type, client, model, prompt)
+
+    if cached is not None:
+        return cached.result()
+
+    try:
+        caption = _request_caption(image_bytes, content_type, client, model, prompt)
+    except BaseException as e:
+        # Failures (including interrupts) are not cached. Waiters see the
+        # error, rather than blocking forever; later calls retry.
+        with _caption_cache_lock:
+            if caption_cache.get(key) is pending:
+                del caption_cache[key]
+        pending.set_exception(e)
+        raise
+    pending.set_result(caption)
+    return caption
+
+
+def _request_caption(
+    image_bytes: bytes, content_type: str, client, model, prompt: str
+) -> Union[None, str]:
+    # Convert to a base64 data-uri
+    data_uri = f"data:{content_type};base64," + base64.b64encode(image_bytes).decode(
+        "ascii"
+    )
 
     # Prepare the OpenAI API request
     messages = [
@@ -1,9 +1,14 @@
 import re
+import functools
 import markdownify
 
 from typing import Any, Optional
 from urllib.parse import quote, unquote, urlparse, urlunparse
 
+# hrefs that urlparse/quote/urlunparse would return unchanged: a fragment, or a
+# path (not network-path reference) made only of characters quote() keeps
+_ESCAPED_HREF_RE = re.compile(r"#[^\t\r\n]+|/(?!/)[A-Za-z0-9_.~/-]*")
+
 
 class _CustomMarkdownify(markdownify.MarkdownConverter):
     """
@@ -31,7 +36,7 @@ class _CustomMarkdownify(markdownify.MarkdownConverter):
     ) -> str:
         """Same as usual, but be sure to start with a new line"""
         if not convert_as_inline:
-            if not re.search(r"^\n", text):
+            if not text.startswith("\n"):
                 return "\n" + super().convert_hn(n, el, text, convert_as_inline)  # type: ignore
 
         return super().convert_hn(n, el, text, convert_as_inline)  # type: ignore
@@ -48,14 +53,21 @@ class _CustomMarkdownify(markdownify.MarkdownConverter):
         if not text:
             return ""
 
-        if el.find_parent("pre") is not None:
+        # markdownify >= 0.14 passes the names of the enclosing tags; older
+        # versions need to walk up the tree
+        parent_tags = kwargs.get("parent_tags")
+        if parent_tags is not None:
+            if "pre" in parent_tags:
+                return text
+        elif el.find_parent("pre") is not None:
             return text
 
         href = el.get("href")
         title = el.get("title")
 
-        # Escape URIs and skip non-http or file schemes
-        if href:
+        # Escape URIs and skip non-http or file schemes. Fragments and plain
+        # site-relative paths are already escaped, and come out unchanged.
+        if href and not _ESCAPED_HREF_RE.fullmatch(href):
             try:
                 parsed_url = urlparse(href)  # type: ignore
                 if parsed_url.scheme and parsed_url.scheme.lower() not in ["http", "https", "file"]:  # type: ignore
@@ -105,7 +117,9 @@ class _CustomMarkdownify(markdownify.MarkdownConverter):
 
         # Remove dataURIs
         if src.startswith("data:") and not self.options["keep_data_uris"]:
-            src = src.split(",")[0] + "..."
+            # Slice rather than split, so the (possibly large) payload isn't copied
+            comma = src.find(",")
+            src = (src[:comma] if comma >= 0 else src) + "..."
 
         return "![%s](%s%s)" % (alt, src, title_part)
 
@@ -124,3 +138,35 @@ class _CustomMarkdownify(markdownify.MarkdownConverter):
 
     def convert_soup(self, soup: Any) -> str:
         return super().convert_soup(soup)  # type: ignore
+
+
+# The options that affect conversion: markdownify's own, plus keep_data_uris
+_MARKDOWNIFY_OPTIONS = frozenset(
+    name
+    for name in vars(markdownify.MarkdownConverter.DefaultOptions)
+    if not name.startswith("_")
+) | {"keep_data_uris"}
+
+
+@functools.lru_cache(maxsize=16)
+def _cached_markdownify(options: tuple) -> _CustomMarkdownify:
+    return _CustomMarkdownify(**dict(options))
+
+
+def get_markdownify(**kwargs: Any) -> _CustomMarkdownify:
+    """
+    Return a _CustomMarkdownify for the given conversion kwargs, reusing an
+    earlier instance when the markdownify options are the same. Instances hold
+    no per-document state, and reuse keeps their tag dispatch cache warm.
+    Options with unhashable values fall back to a fresh instance.
+    """
+    options = tuple(
+        sorted(
+            ((k, v) for k, v in kwargs.items() if k in _MARKDOWNIFY_OPTIONS),
+            key=lambda item: item[0],
+        )
+    )
+    try:
+        return _cached_markdownify(options)
+    except TypeError:
+        return _CustomMarkdownify(**kwargs)
@@ -54,15 +54,17 @@ class OutlookMsgConverter(DocumentConverter):
         finally:
             file_stream.seek(cur_pos)
 
-        # Brue force, check if it's an Outlook file
+        # Brue force, check if it's an Outlook file. Probe for the two entries
+        # directly, rather than listing every stream in the container.
         try:
             if olefile is not None:
                 msg = olefile.OleFileIO(file_stream)
-                toc = "\n".join([str(stream) for stream in msg.listdir()])
-                return (
-                    "__properties_version1.0" in toc
-                    and "__recip_version1.0_#00000000" in toc
-                )
+                try:
+                    return msg.exists("__properties_version1.0") and msg.exists(
+                        "__recip_version1.0_#00000000"
+                    )
+                finally:
+                    msg.close()
         except Exception as e:
             pass
         finally:
@@ -132,18 +134,19 @@ class OutlookMsgConverter(DocumentConverter):
         )  # Ensure msg is of the correct type (type hinting is not possible with the optional olefile package)
 
         try:
-            if msg.exists(stream_path):
-                data = msg.openstream(stream_path).read()
-                # Try UTF-16 first (common for .msg files)
-                try:
-                    return data.decode("utf-16-le").strip()
-                except UnicodeDecodeError:
-                    # Fall back to UTF-8
-                    try:
-                        return data.decode("utf-8").strip()
-                    except UnicodeDecodeError:
-                        # Last resort - ignore errors
-                        return data.decode("utf-8", errors="ignore").strip()
+            # A missing stream raises here, which saves a separate msg.exists()
+            # walk of the OLE directory for the (common) case where it is present
+            data = msg.openstream(stream_path).read()
         except Exception:
-            pass
-        return None
+            return None
+
+        # Try UTF-16 first (common for .msg files)
+        try:
+            return data.decode("utf-16-le").strip()
+        except UnicodeDecodeError:
+            # Fall back to UTF-8
+            try:
+                return data.decode("utf-8").strip()
+            except UnicodeDecodeError:
+                # Last resort - ignore errors
+                return data.decode("utf-8", errors="ignore").strip()
@@ -62,7 +62,9 @@ _dependency_exc_info = None
 try:
     import pdfminer
     import pdfminer.high_level
+    import pdfminer.layout
     import pdfplumber
+    import pypdfium2  # Installed alongside pdfplumber
 except ImportError:
     _dependency_exc_info = sys.exc_info()
 
@@ -74,6 +76,53 @@ ACCEPTED_MIME_TYPE_PREFIXES = [
 
 ACCEPTED_FILE_EXTENSIONS = [".pdf"]
 
+# Engines that can be selected for plain-text extraction via the pdf_backend kwarg
+PDF_BACKENDS = ["pdfminer", "pypdfium2"]
+
+
+def _extract_text_with_pypdfium2(pdf_bytes: BinaryIO) -> str:
+    """
+    Extract plain text page by page with PDFium. This is much faster than
+    pdfminer's layout analysis, at the cost of pdfminer's finer word spacing.
+    """
+    pages: list[str] = []
+    pdf = pypdfium2.PdfDocument(pdf_bytes)
+    try:
+        for page in pdf:
+            textpage = page.get_textpage()
+            pages.append(textpage.get_text_bounded().replace("\r\n", "\n"))
+            textpage.close()
+            page.close()
+    finally:
+        pdf.close()
+    return "\n\n".join(pages)
+
+
+def _extract_plain_text(
+    pdf_bytes: BinaryIO, pdf_backend: str, pdf_layout: bool = True
+) -> str:
+    """
+    Extract the text of the whole document with the selected backend,
+    falling back to pdfminer if the backend fails.
+
+    With pdf_layout=False, pdfminer skips grouping text boxes into reading
+    order (boxes_flow=None). That step is quadratic in the number of boxes;
+    the text is the same, but multi-column pages may come out in a different
+    order.
+    """
+    if pdf_backend == "pypdfium2":
+        pdf_bytes.seek(0)
+        try:
+            return _extract_text_with_pypdfium2(pdf_bytes)
+        except Exception:
+            pass
+    pdf_bytes.seek(0)
+    if pdf_layout:
+        return pdfminer.high_level.extract_text(pdf_bytes)
+    return pdfminer.high_level.extract_text(
+        pdf_bytes, laparams=pdfminer.layout.LAParams(boxes_flow=None)
+    )
+
 
 def _to_markdown_table(table: list[list[str]], include_separator: bool = True) -> str:
     """Convert a 2D list (rows/columns) into a nicely aligned Markdown table.
@@ -497,6 +546,10 @@ class PdfConverter(DocumentConverter):
     Converts PDFs to Markdown.
     Supports extracting tables into aligned Markdown format (via pdfplumber).
     Falls back to pdfminer if pdfplumber is missing or fails.
+
+    Plain-text extraction uses pdfminer by default. Pass pdf_backend="pypdfium2"
+    to use the (much faster) PDFium engine instead, or pdf_layout=False to skip
+    pdfminer's reading-order analysis when text order is not important.
     """
 
     def accepts(
@@ -536,8 +589,19 @@ class PdfConverter(DocumentConverter):
 
         assert isinstance(file_stream, io.IOBase)
 
-        # Read file stream into BytesIO for compatibility with pdfplumber
-        pdf_bytes = io.BytesIO(file_stream.read())
+        pdf_backend = kwargs.get("pdf_backend") or "pdfminer"
+        if pdf_backend not in PDF_BACKENDS:
+            raise ValueError(
+                f"Unknown pdf_backend '{pdf_backend}'. Expected one of: {', '.join(PDF_BACKENDS)}"
+            )
+
+        pdf_layout = kwargs.get("pdf_layout", True)
+
+        # pdfplumber and pdfminer read the PDF from the start of the stream, so
+        # the stream can be used directly unless it is positioned past the start
+        pdf_bytes: BinaryIO = file_stream
+        if file_stream.tell() != 0:
+            pdf_bytes = io.BytesIO(file_stream.read())
 
         try:
             # Single pass: check every page for form-style content.
@@ -568,20 +632,17 @@ class PdfConverter(DocumentConverter):
             # If no pages had form-style content, use pdfminer for
             # the whole document (better text spacing for prose).
             if form_page_count == 0:
-                pdf_bytes.seek(0)
-                markdown = pdfminer.high_level.extract_text(pdf_bytes)
+                markdown = _extract_plain_text(pdf_bytes, pdf_backend, pdf_layout)
             else:
                 markdown = "\n\n".join(markdown_chunks).strip()
 
         except Exception:
             # Fallback if pdfplumber fails
-            pdf_bytes.seek(0)
-            markdown = pdfminer.high_level.extract_text(pdf_bytes)
+            markdown = _extract_plain_text(pdf_bytes, pdf_backend, pdf_layout)
 
         # Fallback if still empty
         if not markdown:
-            pdf_bytes.seek(0)
-            markdown = pdfminer.high_level.extract_text(pdf_bytes)
+            markdown = _extract_plain_text(pdf_bytes, "pdfminer", pdf_layout)
 
         # Post-process to merge MasterFormat-style partial numbering with following text
         markdown = _merge_partial_numbering_lines(markdown)
@@ -1,4 +1,5 @@
 import sys
+import codecs
 
 from typing import BinaryIO, Any
 from charset_normalizer import from_bytes
@@ -29,6 +30,16 @@ ACCEPTED_FILE_EXTENSIONS = [
     ".jsonl",
 ]
 
+# Byte order marks, and the codecs that decode (and strip) them. UTF-32 must
+# be checked first, since its little-endian BOM starts with UTF-16's.
+_BOM_ENCODINGS = [
+    (codecs.BOM_UTF8, "utf-8-sig"),
+    (codecs.BOM_UTF32_LE, "utf-32"),
+    (codecs.BOM_UTF32_BE, "utf-32"),
+    (codecs.BOM_UTF16_LE, "utf-16"),
+    (codecs.BOM_UTF16_BE, "utf-16"),
+]
+
 
 class PlainTextConverter(DocumentConverter):
     """Anything with content type text/plain"""
@@ -66,6 +77,24 @@ class PlainTextConverter(DocumentConverter):
         if stream_info.charset:
             text_content = file_stream.read().decode(stream_info.charset)
         else:
-            text_content = str(from_bytes(file_stream.read()).best())
+            text_content = self._decode(file_stream.read())
 
         return DocumentConverterResult(markdown=text_content)
+
+    def _decode(self, data: bytes) -> str:
+        """Decode text of unknown encoding."""
+        # Most text is UTF-8 (or ASCII), or starts with a BOM. Both are cheap
+        # to check, whereas charset_normalizer probes the whole buffer.
+        for bom, encoding in _BOM_ENCODINGS:
+            if data.startswith(bom):
+                try:
+                    return data.decode(encoding)
+                except UnicodeDecodeError:
+                    break
+        else:
+            try:
+                return data.decode("utf-8")
+            except UnicodeDecodeError:
+                pass
+
+        return str(from_bytes(data).best())
@@ -5,7 +5,8 @@ import io
 import re
 import html
 
-from typing import BinaryIO, Any
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import BinaryIO, Any, List, Union
 from operator import attrgetter
 
 from ._html_converter import HtmlConverter
@@ -30,6 +31,24 @@ ACCEPTED_MIME_TYPE_PREFIXES = [
 
 ACCEPTED_FILE_EXTENSIONS = [".pptx"]
 
+_ALT_TEXT_SPECIAL_CHARS_RE = re.compile(r"[\r\n\[\]]")
+_WHITESPACE_RE = re.compile(r"\s+")
+_NON_WORD_RE = re.compile(r"\W")
+
+# Upper bound on concurrent LLM caption requests per presentation
+_LLM_CAPTION_MAX_WORKERS = 8
+
+
+def _picture_markdown(
+    image_uri: str, alt_text: str, shape_name: str, llm_description: str = ""
+) -> str:
+    # Prepare the alt, escaping any special characters
+    alt_text = "\n".join([llm_description, alt_text]) or shape_name
+    alt_text = _ALT_TEXT_SPECIAL_CHARS_RE.sub(" ", alt_text)
+    alt_text = _WHITESPACE_RE.sub(" ", alt_text).strip()
+
+    return "\n![" + alt_text + "](" + image_uri + ")\n"
+
 
 class PptxConverter(DocumentConverter):
     """
@@ -80,124 +99,173 @@ class PptxConverter(DocumentConverter):
 
         # Perform the conversion
         presentation = pptx.Presentation(file_stream)
-        md_content = ""
-        slide_num = 0
-        for slide in presentation.slides:
-            slide_num += 1
-
-            md_content += f"\n\n<!-- Slide number: {slide_num} -->\n"
-
-            title = slide.shapes.title
-
-            def get_shape_content(shape, **kwargs):
-                nonlocal md_content
-                # Pictures
-                if self._is_picture(shape):
-                    # https://github.com/scanny/python-pptx/pull/512#issuecomment-1713100069
-
-                    llm_description = ""
-                    alt_text = ""
-
-                    # Potentially generate a description using an LLM
-                    llm_client = kwargs.get("llm_client")
-                    llm_model = kwargs.get("llm_model")
-                    if llm_client is not None and llm_model is not None:
-                        # Prepare a file_stream and stream_info for the image data
-                        image_filename = shape.image.filename
-                        image_extension = None
-                        if image_filename:
-                            image_extension = os.path.splitext(image_filename)[1]
-                        image_stream_info = StreamInfo(
-                            mimetype=shape.image.content_type,
-                            extension=image_extension,
-                            filename=image_filename,
-                        )
 
-                        image_stream = io.BytesIO(shape.image.blob)
+        # Image captions are requested concurrently while the slides are walked,
+        # and the slides are only assembled once all of them have been visited
+        caption_executor = None
+        if kwargs.get("llm_client") is not None and kwargs.get("llm_model") is not None:
+            caption_executor = ThreadPoolExecutor(max_workers=_LLM_CAPTION_MAX_WORKERS)
+
+        try:
+            slides = []
+            slide_num = 0
+            for slide in presentation.slides:
+                slide_num += 1
+
+                slide_parts: List[Union[str, Future]] = [
+                    f"\n\n<!-- Slide number: {slide_num} -->\n"
+                ]
 
-                        # Caption the image
+                title = slide.shapes.title
+
+                def get_shape_content(shape, **kwargs):
+                    # Pictures
+                    if self._is_picture(shape):
+                        # https://github.com/scanny/python-pptx/pull/512#issuecomment-1713100069
+
+                        alt_text = ""
+
+                        # Grab any description embedded in the deck
                         try:
-                            llm_description = llm_caption(
-                                image_stream,
-                                image_stream_info,
-                                client=llm_client,
-                                model=llm_model,
-                                prompt=kwargs.get("llm_prompt"),
+                            alt_text = shape._element._nvXxPr.cNvPr.attrib.get(
+                                "descr", ""
                             )
                         except Exception:
-                            # Unable to generate a description
+                            # Unable to get alt text
                             pass
 
-                    # Also grab any description embedded in the deck
-                    try:
-                        alt_text = shape._element._nvXxPr.cNvPr.attrib.get("descr", "")
-                    except Exception:
-                        # Unable to get alt text
-                        pass
-
-                    # Prepare the alt, escaping any special characters
-                    alt_text = "\n".join([llm_description, alt_text]) or shape.name
-                    alt_text = re.sub(r"[\r\n\[\]]", " ", alt_text)
-                    alt_text = re.sub(r"\s+", " ", alt_text).strip()
-
-                    # If keep_data_uris is True, use base64 encoding for images
-                    if kwargs.get("keep_data_uris", False):
-                        blob = shape.image.blob
-                        content_type = shape.image.content_type or "image/png"
-                        b64_string = base64.b64encode(blob).decode("utf-8")
-                        md_content += f"\n![{alt_text}](data:{content_type};base64,{b64_string})\n"
-                    else:
-                        # A placeholder name
-                        filename = re.sub(r"\W", "", shape.name) + ".jpg"
-                        md_content += "\n![" + alt_text + "](" + filename + ")\n"
-
-                # Tables
-                if self._is_table(shape):
-                    md_content += self._convert_table_to_markdown(shape.table, **kwargs)
-
-                # Charts
-                if shape.has_chart:
-                    md_content += self._convert_chart_to_markdown(shape.chart)
-
-                # Text areas
-                elif shape.has_text_frame:
-                    if shape == title:
-                        md_content += "# " + shape.text.lstrip() + "\n"
-                    else:
-                        md_content += shape.text + "\n"
-
-                # Group Shapes
-                if shape.shape_type == pptx.enum.shapes.MSO_SHAPE_TYPE.GROUP:
-                    sorted_shapes = sorted(
-                        shape.shapes,
-                        key=lambda x: (
-                            float("-inf") if not x.top else x.top,
-                            float("-inf") if not x.left else x.left,
-                        ),
-                    )
-                    for subshape in sorted_shapes:
-                        get_shape_content(subshape, **kwargs)
-
-            sorted_shapes = sorted(
-                slide.shapes,
-                key=lambda x: (
-                    float("-inf") if not x.top else x.top,
-                    float("-inf") if not x.left else x.left,
-                ),
-            )
-            for shape in sorted_shapes:
-                get_shape_content(shape, **kwargs)
+                        # If keep_data_uris is True, use base64 encoding for images
+                        if kwargs.get("keep_data_uris", False):
+                            blob = shape.image.blob
+                            content_type = shape.image.content_type or "image/png"
+                            b64_string = base64.b64encode(blob).decode("utf-8")
+                            image_uri = f"data:{content_type};base64,{b64_string}"
+                        else:
+                            # A placeholder name
+                            image_uri = _NON_WORD_RE.sub("", shape.name) + ".jpg"
+
+                        # Potentially generate a description using an LLM
+                        if caption_executor is not None:
+                            # Prepare a file_stream and stream_info for the image data
+                            image_filename = shape.image.filename
+                            image_extension = None
+                            if image_filename:
+                                image_extension = os.path.splitext(image_filename)[1]
+                            image_stream_info = StreamInfo(
+                                mimetype=shape.image.content_type,
+                                extension=image_extension,
+                                filename=image_filename,
+                            )
+
+                            image_stream = io.BytesIO(shape.image.blob)
+
+                            slide_parts.append(
+                                caption_executor.submit(
+                                    self._get_captioned_picture_markdown,
+                                    image_stream,
+                                    image_stream_info,
+                                    image_uri=image_uri,
+                                    alt_text=alt_text,
+                                    shape_name=shape.name,
+                                    **kwargs,
+                                )
+                            )
+                        else:
+                            slide_parts.append(
+                                _picture_markdown(image_uri, alt_text, shape.name)
+                            )
+
+                    # Tables
+                    if self._is_table(shape):
+                        slide_parts.append(
+                            self._convert_table_to_markdown(shape.table, **kwargs)
+                        )
+
+                    # Charts
+                    if shape.has_chart:
+                        slide_parts.append(self._convert_chart_to_markdown(shape.chart))
+
+                    # Text areas
+                    elif shape.has_text_frame:
+                        if shape == title:
+                            slide_parts.append("# " + shape.text.lstrip() + "\n")
+                        else:
+                            slide_parts.append(shape.text + "\n")
+
+                    # Group Shapes
+                    if shape.shape_type == pptx.enum.shapes.MSO_SHAPE_TYPE.GROUP:
+                        sorted_shapes = sorted(
+                            shape.shapes,
+                            key=lambda x: (
+                                float("-inf") if not x.top else x.top,
+                                float("-inf") if not x.left else x.left,
+                            ),
+                        )
+                        for subshape in sorted_shapes:
+                            get_shape_content(subshape, **kwargs)
+
+                sorted_shapes = sorted(
+                    slide.shapes,
+                    key=lambda x: (
+                        float("-inf") if not x.top else x.top,
+                        float("-inf") if not x.left else x.left,
+                    ),
+                )
+                for shape in sorted_shapes:
+                    get_shape_content(shape, **kwargs)
+
+                notes = None
+                if slide.has_notes_slide:
+                    notes = ""
+                    notes_frame = slide.notes_slide.notes_text_frame
+                    if notes_frame is not None:
+                        notes = notes_frame.text
+
+                slides.append((slide_parts, notes))
+
+            # Assemble the slides, waiting on any outstanding captions
+            md_parts = []
+            for slide_parts, notes in slides:
+                slide_md = "".join(
+                    part.result() if isinstance(part, Future) else part
+                    for part in slide_parts
+                ).rstrip()
+
+                if notes is not None:
+                    slide_md = (slide_md + "\n\n### Notes:\n" + notes).rstrip()
+
+                md_parts.append(slide_md)
+        finally:
+            if caption_executor is not None:
+                caption_executor.shutdown(wait=False, cancel_futures=True)
 
-            md_content = md_content.strip()
+        return DocumentConverterResult(markdown="".join(md_parts).strip())
 
-            if slide.has_notes_slide:
-                md_content += "\n\n### Notes:\n"
-                notes_frame = slide.notes_slide.notes_text_frame
-                if notes_frame is not None:
-                    md_content += notes_frame.text
-                md_content = md_content.strip()
+    def _get_captioned_picture_markdown(
+        self,
+        image_stream: BinaryIO,
+        image_stream_info: StreamInfo,
+        *,
+        image_uri: str,
+        alt_text: str,
+        shape_name: str,
+        **kwargs: Any,
+    ) -> str:
+        """Caption a picture with the LLM, then render it. Runs on a worker thread."""
+        llm_description = ""
+        try:
+            llm_description = llm_caption(
+                image_stream,
+                image_stream_info,
+                client=kwargs.get("llm_client"),
+                model=kwargs.get("llm_model"),
+                prompt=kwargs.get("llm_prompt"),
+            )
+        except Exception:
+            # Unable to generate a description
+            pass
 
-        return DocumentConverterResult(markdown=md_content.strip())
+        return _picture_markdown(image_uri, alt_text, shape_name, llm_description)
 
     def _is_picture(self, shape):
         if shape.shape_type == pptx.enum.shapes.MSO_SHAPE_TYPE.PICTURE:
@@ -214,18 +282,19 @@ class PptxConverter(DocumentConverter):
 
     def _convert_table_to_markdown(self, table, **kwargs):
         # Write the table as HTML, then convert it to Markdown
-        html_table = "<html><body><table>"
-        first_row = True
+        html_parts = ["<html><body><table>"]
+        tag = "th"
         for row in table.rows:
-            html_table += "<tr>"
-            for cell in row.cells:
-                if first_row:
-                    html_table += "<th>" + html.escape(cell.text) + "</th>"
-                else:
-                    html_table += "<td>" + html.escape(cell.text) + "</td>"
-            html_table += "</tr>"
-            first_row = False
-        html_table += "</table></body></html>"
+            html_parts.append(
+                "<tr>"
+                + "".join(
+                    f"<{tag}>{html.escape(cell.text)}</{tag}>" for cell in row.cells
+                )
+                + "</tr>"
+            )
+            tag = "td"
+        html_parts.append("</table></body></html>")
+        html_table = "".join(html_parts)
 
         return (
             self._html_converter.convert_string(html_table, **kwargs).markdown.strip()
@@ -238,23 +307,23 @@ class PptxConverter(DocumentConverter):
             if chart.has_title:
                 md += f": {chart.chart_title.text_frame.text}"
             md += "\n\n"
-            data = []
             category_names = [c.label for c in chart.plots[0].categories]
-            series_names = [s.name for s in chart.series]
-            data.append(["Category"] + series_names)
 
-            for idx, category in enumerate(category_names):
-                row = [category]
-                for series in chart.series:
-                    row.append(series.values[idx])
-                data.append(row)
+            # Read each series once, as series.values re-walks the chart XML
+            series_list = list(chart.series)
+            series_names = [s.name for s in series_list]
+            series_values = [s.values for s in series_list]
 
-            markdown_table = []
-            for row in data:
+            header = ["Category"] + series_names
+            markdown_table = [
+                "| " + " | ".join(map(str, header)) + " |",
+                "|" + "|".join(["---"] * len(header)) + "|",
+            ]
+            for idx, category in enumerate(category_names):
+                row = [category] + [values[idx] for values in series_values]
                 markdown_table.append("| " + " | ".join(map(str, row)) + " |")
-            header = markdown_table[0]
-            separator = "|" + "|".join(["---"] * len(data[0])) + "|"
-            return md + "\n".join([header, separator] + markdown_table[1:])
+
+            return md + "\n".join(markdown_table)
         except ValueError as e:
             # Handle the specific error for unsupported chart types
             if "unsupported plot type" in str(e):
@@ -1,9 +1,9 @@
-from defusedxml import minidom
-from xml.dom.minidom import Document, Element
-from typing import BinaryIO, Any, Union
+from defusedxml import ElementTree
+from xml.etree.ElementTree import Element
+from typing import BinaryIO, Any, Dict, Iterator, Set, Union
 from bs4 import BeautifulSoup
 
-from ._markdownify import _CustomMarkdownify
+from ._markdownify import _CustomMarkdownify, get_markdownify
 from .._stream_info import StreamInfo
 from .._base_converter import DocumentConverter, DocumentConverterResult
 
@@ -26,13 +26,56 @@ CANDIDATE_FILE_EXTENSIONS = [
 ]
 
 
+class _FeedDocument:
+    """
+    A parsed XML feed. Elements are looked up by their qualified names as written
+    in the feed (e.g., "title" or "content:encoded"), resolved through the
+    namespace prefixes that the feed declares.
+    """
+
+    def __init__(self, file_stream: BinaryIO):
+        self._namespaces: Dict[str, Set[str]] = {}
+        self._tags: Dict[str, Set[str]] = {}
+        root = None
+        for event, item in ElementTree.iterparse(
+            file_stream, events=("start-ns", "start")
+        ):
+            if event == "start-ns":
+                prefix, uri = item
+                self._namespaces.setdefault(prefix, set()).add(uri)
+            elif root is None:
+                root = item
+        assert root is not None
+        self.root: Element = root
+
+    def _resolve(self, tag_name: str) -> Set[str]:
+        tags = self._tags.get(tag_name)
+        if tags is None:
+            prefix, _, local_name = tag_name.rpartition(":")
+            tags = {
+                "{%s}%s" % (uri, local_name) for uri in self._namespaces.get(prefix, ())
+            }
+            if not prefix:
+                tags.add(local_name)
+            self._tags[tag_name] = tags
+        return tags
+
+    def iter_by_tag_name(self, element: Element, tag_name: str) -> Iterator[Element]:
+        """Iterate over the descendants of element with the given name, in document order."""
+        tags = self._resolve(tag_name)
+        for descendant in element.iter():
+            if descendant is not element and descendant.tag in tags:
+                yield descendant
+
+    def get_elements_by_tag_name(self, tag_name: str) -> list[Element]:
+        """Return the elements of the document with the given name, including the root."""
+        tags = self._resolve(tag_name)
+        return [element for element in self.root.iter() if element.tag in tags]
+
+
 class RssConverter(DocumentConverter):
     """Convert RSS / Atom type to markdown"""
 
-    def __init__(self):
-        super().__init__()
-        self._kwargs = {}
-
     def accepts(
         self,
         file_stream: BinaryIO,
@@ -63,7 +106,7 @@ class RssConverter(DocumentConverter):
     def _check_xml(self, file_stream: BinaryIO) -> bool:
         cur_pos = file_stream.tell()
         try:
-            doc = minidom.parse(file_stream)
+            doc = _FeedDocument(file_stream)
             return self._feed_type(doc) is not None
         except BaseException as _:
             pass
@@ -71,12 +114,12 @@ class RssConverter(DocumentConverter):
             file_stream.seek(cur_pos)
         return False
 
-    def _feed_type(self, doc: Any) -> str | None:
-        if doc.getElementsByTagName("rss"):
+    def _feed_type(self, doc: _FeedDocument) -> str | None:
+        if doc.get_elements_by_tag_name("rss"):
             return "rss"
-        elif doc.getElementsByTagName("feed"):
-            root = doc.getElementsByTagName("feed")[0]
-            if root.getElementsByTagName("entry"):
+        elif doc.get_elements_by_tag_name("feed"):
+            root = doc.get_elements_by_tag_name("feed")[0]
+            if next(doc.iter_by_tag_name(root, "entry"), None) is not None:
                 # An Atom feed must have a root element of <feed> and at least one <entry>
                 return "atom"
         return None
@@ -87,106 +130,107 @@ class RssConverter(DocumentConverter):
         stream_info: StreamInfo,
         **kwargs: Any,  # Options to pass to the converter
     ) -> DocumentConverterResult:
-        self._kwargs = kwargs
-        doc = minidom.parse(file_stream)
+        doc = _FeedDocument(file_stream)
         feed_type = self._feed_type(doc)
 
+        # One markdownify instance serves every item in the feed
+        _markdownify = get_markdownify(**kwargs)
         if feed_type == "rss":
-            return self._parse_rss_type(doc)
+            return self._parse_rss_type(doc, _markdownify)
         elif feed_type == "atom":
-            return self._parse_atom_type(doc)
+            return self._parse_atom_type(doc, _markdownify)
         else:
             raise ValueError("Unknown feed type")
 
-    def _parse_atom_type(self, doc: Document) -> DocumentConverterResult:
+    def _parse_atom_type(
+        self, doc: _FeedDocument, _markdownify: _CustomMarkdownify
+    ) -> DocumentConverterResult:
         """Parse the type of an Atom feed.
 
         Returns None if the feed type is not recognized or something goes wrong.
         """
-        root = doc.getElementsByTagName("feed")[0]
-        title = self._get_data_by_tag_name(root, "title")
-        subtitle = self._get_data_by_tag_name(root, "subtitle")
-        entries = root.getElementsByTagName("entry")
-        md_text = f"# {title}\n"
+        root = doc.get_elements_by_tag_name("feed")[0]
+        title = self._get_data_by_tag_name(doc, root, "title")
+        subtitle = self._get_data_by_tag_name(doc, root, "subtitle")
+        entries = doc.iter_by_tag_name(root, "entry")
+        md_parts = [f"# {title}\n"]
         if subtitle:
-            md_text += f"{subtitle}\n"
+            md_parts.append(f"{subtitle}\n")
         for entry in entries:
-            entry_title = self._get_data_by_tag_name(entry, "title")
-            entry_summary = self._get_data_by_tag_name(entry, "summary")
-            entry_updated = self._get_data_by_tag_name(entry, "updated")
-            entry_content = self._get_data_by_tag_name(entry, "content")
+            entry_title = self._get_data_by_tag_name(doc, entry, "title")
+            entry_summary = self._get_data_by_tag_name(doc, entry, "summary")
+            entry_updated = self._get_data_by_tag_name(doc, entry, "updated")
+            entry_content = self._get_data_by_tag_name(doc, entry, "content")
 
             if entry_title:
-                md_text += f"\n## {entry_title}\n"
+                md_parts.append(f"\n## {entry_title}\n")
             if entry_updated:
-                md_text += f"Updated on: {entry_updated}\n"
+                md_parts.append(f"Updated on: {entry_updated}\n")
             if entry_summary:
-                md_text += self._parse_content(entry_summary)
+                md_parts.append(self._parse_content(entry_summary, _markdownify))
             if entry_content:
-                md_text += self._parse_content(entry_content)
+                md_parts.append(self._parse_content(entry_content, _markdownify))
 
         return DocumentConverterResult(
-            markdown=md_text,
+            markdown="".join(md_parts),
             title=title,
         )
 
-    def _parse_rss_type(self, doc: Document) -> DocumentConverterResult:
+    def _parse_rss_type(
+        self, doc: _FeedDocument, _markdownify: _CustomMarkdownify
+    ) -> DocumentConverterResult:
         """Parse the type of an RSS feed.
 
         Returns None if the feed type is not recognized or something goes wrong.
         """
-        root = doc.getElementsByTagName("rss")[0]
-        channel_list = root.getElementsByTagName("channel")
-        if not channel_list:
+        root = doc.get_elements_by_tag_name("rss")[0]
+        channel = next(doc.iter_by_tag_name(root, "channel"), None)
+        if channel is None:
             raise ValueError("No channel found in RSS feed")
-        channel = channel_list[0]
-        channel_title = self._get_data_by_tag_name(channel, "title")
-        channel_description = self._get_data_by_tag_name(channel, "description")
-        items = channel.getElementsByTagName("item")
+        channel_title = self._get_data_by_tag_name(doc, channel, "title")
+        channel_description = self._get_data_by_tag_name(doc, channel, "description")
+        items = doc.iter_by_tag_name(channel, "item")
+        md_parts = []
         if channel_title:
-            md_text = f"# {channel_title}\n"
+            md_parts.append(f"# {channel_title}\n")
         if channel_description:
-            md_text += f"{channel_description}\n"
+            md_parts.append(f"{channel_description}\n")
         for item in items:
-            title = self._get_data_by_tag_name(item, "title")
-            description = self._get_data_by_tag_name(item, "description")
-            pubDate = self._get_data_by_tag_name(item, "pubDate")
-            content = self._get_data_by_tag_name(item, "content:encoded")
+            title = self._get_data_by_tag_name(doc, item, "title")
+            description = self._get_data_by_tag_name(doc, item, "description")
+            pubDate = self._get_data_by_tag_name(doc, item, "pubDate")
+            content = self._get_data_by_tag_name(doc, item, "content:encoded")
 
             if title:
-                md_text += f"\n## {title}\n"
+                md_parts.append(f"\n## {title}\n")
             if pubDate:
-                md_text += f"Published on: {pubDate}\n"
+                md_parts.append(f"Published on: {pubDate}\n")
             if description:
-                md_text += self._parse_content(description)
+                md_parts.append(self._parse_content(description, _markdownify))
             if content:
-                md_text += self._parse_content(content)
+                md_parts.append(self._parse_content(content, _markdownify))
 
         return DocumentConverterResult(
-            markdown=md_text,
+            markdown="".join(md_parts),
             title=channel_title,
         )
 
-    def _parse_content(self, content: str) -> str:
+    def _parse_content(self, content: str, _markdownify: _CustomMarkdownify) -> str:
         """Parse the content of an RSS feed item"""
         try:
             # using bs4 because many RSS feeds have HTML-styled content
             soup = BeautifulSoup(content, "html.parser")
-            return _CustomMarkdownify(**self._kwargs).convert_soup(soup)
+            return _markdownify.convert_soup(soup)
         except BaseException as _:
             return content
 
     def _get_data_by_tag_name(
-        self, element: Element, tag_name: str
+        self, doc: _FeedDocument, element: Element, tag_name: str
     ) -> Union[str, None]:
-        """Get data from first child element with the given tag name.
-        Returns None when no such element is found.
+        """Get the text of the first descendant element with the given tag name.
+        Returns None when no such element is found, or when it has no leading text.
         """
-        nodes = element.getElementsByTagName(tag_name)
-        if not nodes:
+        node = next(doc.iter_by_tag_name(element, tag_name), None)
+        if node is None:
             return None
-        fc = nodes[0].firstChild
-        if fc:
-            if hasattr(fc, "data"):
-                return fc.data
-        return None
+        return node.text
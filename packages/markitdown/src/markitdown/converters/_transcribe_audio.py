@@ -1,6 +1,6 @@
-import io
 import sys
-from typing import BinaryIO
+import threading
+from typing import Any, BinaryIO, Dict, Optional
 from .._exceptions import MissingDependencyException
 
 # Try loading optional (but in this case, required) dependencies
@@ -19,8 +19,32 @@ except ImportError:
     # Preserve the error and stack trace for later
     _dependency_exc_info = sys.exc_info()
 
+TRANSCRIPTION_BACKENDS = ["google", "faster-whisper"]
+
+# Default faster-whisper model, and the models loaded so far (shared across calls)
+DEFAULT_WHISPER_MODEL = "small"
+_whisper_models: Dict[str, Any] = {}
+_whisper_models_lock = threading.Lock()
+
+
+def transcribe_audio(
+    file_stream: BinaryIO,
+    *,
+    audio_format: str = "wav",
+    backend: Optional[str] = None,
+    whisper_model: Optional[str] = None,
+) -> str:
+    backend = backend or "google"
+    if backend not in TRANSCRIPTION_BACKENDS:
+        raise ValueError(
+            f"Unknown transcription backend '{backend}'. Expected one of: {', '.join(TRANSCRIPTION_BACKENDS)}"
+        )
+
+    if backend == "faster-whisper":
+        return _transcribe_with_faster_whisper(
+            file_stream, model_size=whisper_model or DEFAULT_WHISPER_MODEL
+        )
 
-def transcribe_audio(file_stream: BinaryIO, *, audio_format: str = "wav") -> str:
     # Check for installed dependencies
     if _dependency_exc_info is not None:
         raise MissingDependencyException(
@@ -31,19 +55,49 @@ def transcribe_audio(file_stream: BinaryIO, *, audio_format: str = "wav") -> str
             _dependency_exc_info[2]
         )
 
+    recognizer = sr.Recognizer()
+
     if audio_format in ["wav", "aiff", "flac"]:
-        audio_source = file_stream
+        with sr.AudioFile(file_stream) as source:
+            audio = recognizer.record(source)
     elif audio_format in ["mp3", "mp4"]:
-        audio_segment = pydub.AudioSegment.from_file(file_stream, format=audio_format)
-
-        audio_source = io.BytesIO()
-        audio_segment.export(audio_source, format="wav")
-        audio_source.seek(0)
+        # Hand the decoded PCM samples straight to the recognizer, rather than
+        # re-encoding them as WAV only to have sr.AudioFile parse them back out
+        audio_segment = pydub.AudioSegment.from_file(
+            file_stream, format=audio_format
+        ).set_channels(1)
+        audio = sr.AudioData(
+            audio_segment.raw_data,
+            audio_segment.frame_rate,
+            audio_segment.sample_width,
+        )
     else:
         raise ValueError(f"Unsupported audio format: {audio_format}")
 
-    recognizer = sr.Recognizer()
-    with sr.AudioFile(audio_source) as source:
-        audio = recognizer.record(source)
-        transcript = recognizer.recognize_google(audio).strip()
-        return "[No speech detected]" if transcript == "" else transcript
+    transcript = recognizer.recognize_google(audio).strip()
+    return "[No speech detected]" if transcript == "" else transcript
+
+
+def _transcribe_with_faster_whisper(file_stream: BinaryIO, *, model_size: str) -> str:
+    """
+    Transcribe locally with faster-whisper (int8 CTranslate2 Whisper), which avoids
+    a network round trip per file. Models are loaded once and then reused.
+    """
+    # Imported here, rather than with the module, since faster-whisper pulls in
+    # ctranslate2, av and huggingface_hub, and is only needed when selected
+    try:
+        import faster_whisper
+    except ImportError as e:
+        raise MissingDependencyException(
+            "Local speech transcription requires installing MarkItdown with the [audio-transcription-local] optional dependencies. E.g., `pip install markitdown[audio-transcription-local]`"
+        ) from e
+
+    with _whisper_models_lock:
+        model = _whisper_models.get(model_size)
+        if model is None:
+            model = faster_whisper.WhisperModel(model_size, compute_type="int8")
+            _whisper_models[model_size] = model
+
+    segments, _ = model.transcribe(file_stream, beam_size=1)
+    transcript = " ".join(segment.text.strip() for segment in segments).strip()
+    return "[No speech detected]" if transcript == "" else transcript
@@ -4,7 +4,8 @@ from typing import Any, BinaryIO
 
 from .._base_converter import DocumentConverter, DocumentConverterResult
 from .._stream_info import StreamInfo
-from ._markdownify import _CustomMarkdownify
+from ._html_converter import _HTML_PARSER
+from ._markdownify import get_markdownify
 
 ACCEPTED_MIME_TYPE_PREFIXES = [
     "text/html",
@@ -16,6 +17,8 @@ ACCEPTED_FILE_EXTENSIONS = [
     ".htm",
 ]
 
+_WIKIPEDIA_URL_RE = re.compile(r"^https?:\/\/[a-zA-Z]{2,3}\.wikipedia.org\/")
+
 
 class WikipediaConverter(DocumentConverter):
     """Handle Wikipedia pages separately, focusing only on the main document content."""
@@ -34,7 +37,7 @@ class WikipediaConverter(DocumentConverter):
         mimetype = (stream_info.mimetype or "").lower()
         extension = (stream_info.extension or "").lower()
 
-        if not re.search(r"^https?:\/\/[a-zA-Z]{2,3}\.wikipedia.org\/", url):
+        if not _WIKIPEDIA_URL_RE.match(url):
             # Not a Wikipedia URL
             return False
 
@@ -56,7 +59,7 @@ class WikipediaConverter(DocumentConverter):
     ) -> DocumentConverterResult:
         # Parse the stream
         encoding = "utf-8" if stream_info.charset is None else stream_info.charset
-        soup = bs4.BeautifulSoup(file_stream, "html.parser", from_encoding=encoding)
+        soup = bs4.BeautifulSoup(file_stream, _HTML_PARSER, from_encoding=encoding)
 
         # Remove javascript and style blocks
         for script in soup(["script", "style"]):
@@ -75,11 +78,15 @@ class WikipediaConverter(DocumentConverter):
                 main_title = title_elm.string
 
             # Convert the page
-            webpage_text = f"# {main_title}\n\n" + _CustomMarkdownify(
+            webpage_text = f"# {main_title}\n\n" + get_markdownify(
                 **kwargs
             ).convert_soup(body_elm)
         else:
-            webpage_text = _CustomMarkdownify(**kwargs).convert_soup(soup)
+            # Not a regular article; like HtmlConverter, skip the <head>
+            page_elm = soup.find("body")
+            webpage_text = get_markdownify(**kwargs).convert_soup(
+                page_elm if page_elm else soup
+            )
 
         return DocumentConverterResult(
             markdown=webpage_text,
@@ -21,6 +21,15 @@ try:
 except ImportError:
     _xls_dependency_exc_info = sys.exc_info()
 
+# Prefer the (much faster) Rust-based calamine engine when it is installed
+_calamine_available = False
+try:
+    import python_calamine  # noqa: F401
+
+    _calamine_available = True
+except ImportError:
+    pass
+
 ACCEPTED_XLSX_MIME_TYPE_PREFIXES = [
     "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet"
 ]
@@ -33,6 +42,22 @@ ACCEPTED_XLS_MIME_TYPE_PREFIXES = [
 ACCEPTED_XLS_FILE_EXTENSIONS = [".xls"]
 
 
+def _read_excel(file_stream: BinaryIO, engine: str) -> dict:
+    """
+    Read all sheets of a workbook into DataFrames, using calamine if possible
+    and falling back to the given engine otherwise.
+    """
+    if _calamine_available:
+        cur_pos = file_stream.tell()
+        try:
+            return pd.read_excel(file_stream, sheet_name=None, engine="calamine")
+        except Exception:
+            # Older pandas releases, or workbooks calamine can't read
+            file_stream.seek(cur_pos)
+
+    return pd.read_excel(file_stream, sheet_name=None, engine=engine)
+
+
 class XlsxConverter(DocumentConverter):
     """
     Converts XLSX files to Markdown, with each sheet presented as a separate Markdown table.
@@ -80,7 +105,7 @@ class XlsxConverter(DocumentConverter):
                 _xlsx_dependency_exc_info[2]
             )
 
-        sheets = pd.read_excel(file_stream, sheet_name=None, engine="openpyxl")
+        sheets = _read_excel(file_stream, engine="openpyxl")
         md_content = ""
         for s in sheets:
             md_content += f"## {s}\n"
@@ -142,7 +167,7 @@ class XlsConverter(DocumentConverter):
                 _xls_dependency_exc_info[2]
             )
 
-        sheets = pd.read_excel(file_stream, sheet_name=None, engine="xlrd")
+        sheets = _read_excel(file_stream, engine="xlrd")
         md_content = ""
         for s in sheets:
             md_content += f"## {s}\n"
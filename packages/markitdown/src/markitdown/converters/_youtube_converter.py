@@ -2,11 +2,13 @@ import json
 import time
 import re
 import bs4
-from typing import Any, BinaryIO, Dict, List, Union
+from itertools import repeat
+from typing import Any, BinaryIO, Dict, Iterator, List, Tuple, Union
 from urllib.parse import parse_qs, urlparse, unquote
 
 from .._base_converter import DocumentConverter, DocumentConverterResult
 from .._stream_info import StreamInfo
+from ._html_converter import _HTML_PARSER
 
 # Optional YouTube transcription support
 try:
@@ -33,6 +35,14 @@ ACCEPTED_FILE_EXTENSIONS = [
     ".htm",
 ]
 
+_META_KEY_ATTRIBUTES = frozenset(["itemprop", "property", "name"])
+
+_YT_INITIAL_DATA_RE = re.compile(r"var ytInitialData = ({.*?});")
+_YT_DESCRIPTION_KEY = '"attributedDescriptionBodyText"'
+_YT_DESCRIPTION_RE = re.compile(
+    r'"attributedDescriptionBodyText"\s*:\s*\{\s*"content"\s*:\s*("(?:[^"\\]|\\.)*")'
+)
+
 
 class YouTubeConverter(DocumentConverter):
     """Handle YouTube specially, focusing on the video title, description, and transcript."""
@@ -75,7 +85,7 @@ class YouTubeConverter(DocumentConverter):
     ) -> DocumentConverterResult:
         # Parse the stream
         encoding = "utf-8" if stream_info.charset is None else stream_info.charset
-        soup = bs4.BeautifulSoup(file_stream, "html.parser", from_encoding=encoding)
+        soup = bs4.BeautifulSoup(file_stream, _HTML_PARSER, from_encoding=encoding)
 
         # Read the meta tags
         metadata: Dict[str, str] = {}
@@ -83,12 +93,13 @@ class YouTubeConverter(DocumentConverter):
         if soup.title and soup.title.string:
             metadata["title"] = soup.title.string
 
-        for meta in soup(["meta"]):
+        for meta in soup.find_all("meta"):
             if not isinstance(meta, bs4.Tag):
                 continue
 
+            # The first naming attribute, in the order written, gives the key
             for a in meta.attrs:
-                if a in ["itemprop", "property", "name"]:
+                if a in _META_KEY_ATTRIBUTES:
                     key = str(meta.get(a, ""))
                     content = str(meta.get("content", ""))
                     if key and content:  # Only add non-empty content
@@ -104,12 +115,11 @@ class YouTubeConverter(DocumentConverter):
                     continue
                 content = script.string
                 if "ytInitialData" in content:
-                    match = re.search(r"var ytInitialData = ({.*?});", content)
+                    match = _YT_INITIAL_DATA_RE.search(content)
                     if match:
-                        data = json.loads(match.group(1))
-                        attrdesc = self._findKey(data, "attributedDescriptionBodyText")
-                        if attrdesc and isinstance(attrdesc, dict):
-                            metadata["description"] = str(attrdesc.get("content", ""))
+                        description = self._extract_description(match)
+                        if description is not None:
+                            metadata["description"] = description
                     break
         except Exception as e:
             print(f"Error extracting description: {e}")
@@ -208,19 +218,48 @@ class YouTubeConverter(DocumentConverter):
                 return metadata[k]
         return default
 
+    def _extract_description(self, match: "re.Match[str]") -> Union[str, None]:
+        """Extract the video description from a ytInitialData match."""
+        # The description is almost always serialized as
+        # "attributedDescriptionBodyText":{"content":"..."}, so read it straight
+        # from the text rather than parsing the whole (often multi-megabyte)
+        # blob. Since JSON text order is document order, the first occurrence
+        # is the one _findKey would return. Anything unusual falls back to a
+        # full parse.
+        content = match.string
+        start, end = match.span(1)
+        pos = content.find(_YT_DESCRIPTION_KEY, start, end)
+        if pos < 0:
+            return None
+
+        desc_match = _YT_DESCRIPTION_RE.match(content, pos, end)
+        if desc_match:
+            return json.loads(desc_match.group(1))
+
+        data = json.loads(match.group(1))
+        attrdesc = self._findKey(data, "attributedDescriptionBodyText")
+        if attrdesc and isinstance(attrdesc, dict):
+            return str(attrdesc.get("content", ""))
+        return None
+
     def _findKey(self, json: Any, key: str) -> Union[str, None]:  # TODO: Fix json type
-        """Recursively search for a key in nested dictionary/list structures."""
-        if isinstance(json, list):
-            for elm in json:
-                ret = self._findKey(elm, key)
-                if ret is not None:
-                    return ret
-        elif isinstance(json, dict):
-            for k, v in json.items():
-                if k == key:
-                    return json[k]
-                if result := self._findKey(v, key):
-                    return result
+        """Depth-first search for a key in nested dictionary/list structures."""
+        # Walk with an explicit stack of iterators rather than recursion, so
+        # deeply nested ytInitialData can't hit the recursion limit. Keys are
+        # still visited in document order.
+        stack: List[Iterator[Tuple[Any, Any]]] = [iter(((None, json),))]
+        while stack:
+            for k, v in stack[-1]:
+                if k == key and v:
+                    return v
+                if isinstance(v, dict):
+                    stack.append(iter(v.items()))
+                    break
+                if isinstance(v, list):
+                    stack.append(zip(repeat(None), v))
+                    break
+            else:
+                stack.pop()
         return None
 
     def _retry_operation(self, operation, retries=3, delay=2):
@@ -1,8 +1,12 @@
 import zipfile
 import io
 import os
+import shutil
+import tempfile
+import threading
+from concurrent.futures import ThreadPoolExecutor
 
-from typing import BinaryIO, Any, TYPE_CHECKING
+from typing import BinaryIO, Any, Optional, TYPE_CHECKING
 
 from .._base_converter import DocumentConverter, DocumentConverterResult
 from .._stream_info import StreamInfo
@@ -18,13 +22,25 @@ ACCEPTED_MIME_TYPE_PREFIXES = [
 
 ACCEPTED_FILE_EXTENSIONS = [".zip"]
 
+# Members larger than this are decompressed to a temporary file rather than memory
+MAX_IN_MEMORY_MEMBER_SIZE = 8 * 1024 * 1024
+
+# Upper bound on the members of an archive converted at once
+_ZIP_MAX_WORKERS = 4
+
+# Tracks whether the current thread is converting a ZIP member, so that nested
+# archives are converted in that thread rather than starting pools of their own
+_member_conversion = threading.local()
+
 
 class ZipConverter(DocumentConverter):
     """Converts ZIP files to markdown by extracting and converting all contained files.
 
-    The converter extracts the ZIP contents to a temporary directory, processes each file
-    using appropriate converters based on file extensions, and then combines the results
-    into a single markdown document. The temporary directory is cleaned up after processing.
+    The converter reads the members of the ZIP, processes them a few at a time using
+    appropriate converters based on file extensions, and then combines the results
+    into a single markdown document, in archive order. Nested archives are processed
+    one member at a time, in the thread converting them. Large members are spooled
+    to temporary files, which are removed as soon as they have been converted.
 
     Example output format:
     ```markdown
@@ -91,26 +107,77 @@ class ZipConverter(DocumentConverter):
         **kwargs: Any,  # Options to pass to the converter
     ) -> DocumentConverterResult:
         file_path = stream_info.url or stream_info.local_path or stream_info.filename
-        md_content = f"Content from the zip file `{file_path}`:\n\n"
+        md_parts = [f"Content from the zip file `{file_path}`:\n\n"]
 
         with zipfile.ZipFile(file_stream, "r") as zipObj:
-            for name in zipObj.namelist():
+            # Directory entries have no content to convert
+            members = [info for info in zipObj.infolist() if not info.is_dir()]
+
+            if len(members) < 2 or getattr(_member_conversion, "active", False):
+                member_mds = [self._convert_member(zipObj, info) for info in members]
+            else:
+                # Members are converted concurrently, since most converters
+                # spend their time in file I/O, subprocesses or HTTP calls.
+                # Results are collected in archive order.
+                executor = ThreadPoolExecutor(
+                    max_workers=min(_ZIP_MAX_WORKERS, len(members))
+                )
                 try:
-                    z_file_stream = io.BytesIO(zipObj.read(name))
-                    z_file_stream_info = StreamInfo(
-                        extension=os.path.splitext(name)[1],
-                        filename=os.path.basename(name),
-                    )
-                    result = self._markitdown.convert_stream(
-                        stream=z_file_stream,
-                        stream_info=z_file_stream_info,
-                    )
-                    if result is not None:
-                        md_content += f"## File: {name}\n\n"
-                        md_content += result.markdown + "\n\n"
-                except UnsupportedFormatException:
-                    pass
-                except FileConversionException:
-                    pass
-
-        return DocumentConverterResult(markdown=md_content.strip())
+                    futures = [
+                        executor.submit(self._convert_member, zipObj, info)
+                        for info in members
+                    ]
+                    member_mds = [future.result() for future in futures]
+                finally:
+                    executor.shutdown(wait=True, cancel_futures=True)
+
+        md_parts.extend(md for md in member_mds if md is not None)
+
+        return DocumentConverterResult(markdown="".join(md_parts).strip())
+
+    def _convert_member(
+        self, zipObj: zipfile.ZipFile, info: zipfile.ZipInfo
+    ) -> Optional[str]:
+        """Convert a single member, returning its Markdown section if supported."""
+        name = info.filename
+        was_active = getattr(_member_conversion, "active", False)
+        _member_conversion.active = True
+        try:
+            with self._open_member(zipObj, info) as z_file_stream:
+                z_file_stream_info = StreamInfo(
+                    extension=os.path.splitext(name)[1],
+                    filename=os.path.basename(name),
+                )
+                result = self._markitdown.convert_stream(
+                    stream=z_file_stream,
+                    stream_info=z_file_stream_info,
+                )
+        except UnsupportedFormatException:
+            return None
+        except FileConversionException:
+            return None
+        finally:
+            _member_conversion.active = was_active
+
+        if result is None:
+            return None
+        return f"## File: {name}\n\n" + result.markdown + "\n\n"
+
+    def _open_member(self, zipObj: zipfile.ZipFile, info: zipfile.ZipInfo) -> BinaryIO:
+        """
+        Decompress a member into a seekable stream. Small members are read into
+        memory, while large ones are streamed into a temporary file, so that peak
+        memory does not grow with the size of the largest member.
+        """
+        if info.file_size <= MAX_IN_MEMORY_MEMBER_SIZE:
+            return io.BytesIO(zipObj.read(info))
+
+        member_stream = tempfile.TemporaryFile()
+        try:
+            with zipObj.open(info) as src:
+                shutil.copyfileobj(src, member_stream, 1024 * 1024)
+            member_stream.seek(0)
+        except BaseException:
+            member_stream.close()
+            raise
+        return member_stream
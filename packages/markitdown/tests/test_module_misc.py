@@ -1,18 +1,41 @@
 #!/usr/bin/env python3 -m pytest
+import base64
+import codecs
+import gc
 import io
+import json
 import os
 import re
 import shutil
+import sys
+import types
+import weakref
+import zipfile
 import pytest
-from unittest.mock import MagicMock
+from xml.etree.ElementTree import ParseError
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import MagicMock, patch
 
+import markitdown._markitdown as markitdown_module
 from markitdown._uri_utils import parse_data_uri, file_uri_to_path
+from markitdown.converters import (
+    ImageConverter,
+    PlainTextConverter,
+    RssConverter,
+    YouTubeConverter,
+)
+from markitdown.converters import _markdownify as markdownify_module
+from markitdown.converters._llm_caption import llm_caption
+from markitdown.converters._transcribe_audio import transcribe_audio
+from markitdown.converters._zip_converter import _ZIP_MAX_WORKERS
 
 from markitdown import (
     MarkItDown,
+    DocumentConverter,
     UnsupportedFormatException,
     FileConversionException,
     StreamInfo,
+    MissingDependencyException,
 )
 
 # This file contains module tests that are not directly tested by the FileTestVectors.
@@ -417,6 +440,43 @@ def test_speech_transcription() -> None:
         )
 
 
+def test_transcription_backends() -> None:
+    audio_stream = io.BytesIO(b"not really audio")
+
+    # Unknown backends are rejected
+    with pytest.raises(ValueError):
+        transcribe_audio(audio_stream, backend="not-a-backend")
+
+    # The local backend reports its missing dependency when selected
+    with patch.dict(sys.modules, {"faster_whisper": None}):
+        with pytest.raises(MissingDependencyException):
+            transcribe_audio(audio_stream, backend="faster-whisper")
+
+    # The requested model is loaded, once, and used
+    loaded_models = []
+
+    class WhisperModel:
+        def __init__(self, model_size, **kwargs):
+            loaded_models.append(model_size)
+
+        def transcribe(self, file_stream, **kwargs):
+            return [types.SimpleNamespace(text=" one two three ")], None
+
+    faster_whisper = types.ModuleType("faster_whisper")
+    faster_whisper.WhisperModel = WhisperModel  # type: ignore[attr-defined]
+    with patch.dict(sys.modules, {"faster_whisper": faster_whisper}), patch.dict(
+        "markitdown.converters._transcribe_audio._whisper_models"
+    ):
+        for _ in range(2):
+            result = MarkItDown().convert(
+                os.path.join(TEST_FILES_DIR, "test.wav"),
+                audio_transcription_backend="faster-whisper",
+                whisper_model="test-model-5b1e",
+            )
+            assert "### Audio Transcript:\none two three" in result.markdown
+    assert loaded_models == ["test-model-5b1e"]
+
+
 def test_exceptions() -> None:
     # Check that an exception is raised when trying to convert an unsupported format
     markitdown = MarkItDown()
@@ -432,6 +492,361 @@ def test_exceptions() -> None:
     assert type(exc_info.value.attempts[0].converter).__name__ == "PptxConverter"
 
 
+def test_pdf_backend() -> None:
+    markitdown = MarkItDown()
+
+    # The PDFium backend extracts the same prose as pdfminer
+    result = markitdown.convert(
+        os.path.join(TEST_FILES_DIR, "test.pdf"), pdf_backend="pypdfium2"
+    )
+    validate_strings(result, PDF_TEST_STRINGS)
+
+    # Skipping pdfminer's reading-order analysis keeps the same text
+    result = markitdown.convert(
+        os.path.join(TEST_FILES_DIR, "test.pdf"), pdf_layout=False
+    )
+    validate_strings(result, PDF_TEST_STRINGS)
+
+    # Unknown backends are reported as a failed conversion
+    with pytest.raises(FileConversionException):
+        markitdown.convert(
+            os.path.join(TEST_FILES_DIR, "test.pdf"), pdf_backend="not-a-backend"
+        )
+
+
+def test_converter_kwargs() -> None:
+    """Test that converters are handed the caller's objects, not copies."""
+    seen_kwargs = []
+
+    class KwargsRecorder(DocumentConverter):
+        def accepts(self, file_stream, stream_info, **kwargs):
+            seen_kwargs.append(kwargs)
+            return False
+
+    llm_client = MagicMock()
+    markitdown = MarkItDown(llm_client=llm_client, llm_model="gpt-4o")
+    markitdown.register_converter(KwargsRecorder())
+    markitdown.convert_stream(
+        io.BytesIO(b"Hello world"),
+        stream_info=StreamInfo(extension=".txt"),
+        custom_option=[1, 2, 3],
+    )
+
+    assert len(seen_kwargs) > 0
+    for kwargs in seen_kwargs:
+        assert kwargs["llm_client"] is llm_client
+        assert kwargs["custom_option"] == [1, 2, 3]
+    assert seen_kwargs[0]["file_extension"] == ".txt"
+    assert seen_kwargs[0]["custom_option"] is seen_kwargs[-1]["custom_option"]
+
+
+def test_non_seekable_stream() -> None:
+    class NonSeekableStream(io.RawIOBase):
+        def __init__(self, data: bytes):
+            self._data = io.BytesIO(data)
+
+        def readable(self) -> bool:
+            return True
+
+        def seekable(self) -> bool:
+            return False
+
+        def readinto(self, b) -> int:
+            return self._data.readinto(b)
+
+    markitdown = MarkItDown()
+    with open(os.path.join(TEST_FILES_DIR, "test.docx"), "rb") as fh:
+        data = fh.read()
+    expected = markitdown.convert_stream(io.BytesIO(data)).markdown
+
+    # Buffered in memory
+    result = markitdown.convert_stream(NonSeekableStream(data))
+    assert result.markdown == expected
+
+    # A non-blocking stream with no data available reads as None
+    class NonBlockingStream(NonSeekableStream):
+        def read(self, size=-1):
+            return super().read(size) or None
+
+    result = markitdown.convert_stream(
+        NonBlockingStream(b"Hello world"), stream_info=StreamInfo(extension=".txt")
+    )
+    assert result.markdown == "Hello world"
+
+    # Spooled to a temporary file
+    spool_max_size = markitdown_module._SPOOL_MAX_SIZE
+    markitdown_module._SPOOL_MAX_SIZE = 1024
+    try:
+        result = markitdown.convert_stream(NonSeekableStream(data))
+    finally:
+        markitdown_module._SPOOL_MAX_SIZE = spool_max_size
+    assert result.markdown == expected
+
+
+def test_zip_members() -> None:
+    def make_zip(members):
+        zip_stream = io.BytesIO()
+        with zipfile.ZipFile(zip_stream, "w") as zip_file:
+            for name, data in members:
+                zip_file.writestr(name, data)
+        return zip_stream.getvalue()
+
+    with open(os.path.join(TEST_FILES_DIR, "random.bin"), "rb") as fh:
+        random_bytes = fh.read()
+    inner_zip = make_zip([("inner1.txt", "Inner one"), ("inner2.txt", "Inner two")])
+    outer_zip = make_zip(
+        [
+            ("c.txt", "Member c"),
+            ("a.txt", "Member a"),
+            ("broken.pptx", random_bytes),
+            ("nested.zip", inner_zip),
+            ("b.txt", "Member b"),
+        ]
+    )
+
+    markitdown = MarkItDown()
+    with patch(
+        "markitdown.converters._zip_converter.ThreadPoolExecutor",
+        wraps=ThreadPoolExecutor,
+    ) as executor_class:
+        result = markitdown.convert_stream(
+            io.BytesIO(outer_zip), stream_info=StreamInfo(extension=".zip")
+        )
+
+    # Members appear in archive order, including the nested archive's, and a
+    # corrupted member is skipped without affecting the others
+    assert re.findall(r"^## File: (.*)$", result.markdown, re.MULTILINE) == [
+        "c.txt",
+        "a.txt",
+        "nested.zip",
+        "inner1.txt",
+        "inner2.txt",
+        "b.txt",
+    ]
+    assert "Inner two" in result.markdown
+
+    # Only the outer archive starts a thread pool, and it is bounded
+    assert executor_class.call_count == 1
+    assert executor_class.call_args.kwargs["max_workers"] <= _ZIP_MAX_WORKERS
+
+
+def test_plain_text_decoding() -> None:
+    converter = PlainTextConverter()
+    text = "Héllo wörld, ça va? \u2603"
+
+    def decode(data):
+        return converter.convert(
+            io.BytesIO(data), StreamInfo(extension=".txt")
+        ).markdown
+
+    # Byte order marks select the encoding, and are stripped
+    assert decode(codecs.BOM_UTF8 + text.encode("utf-8")) == text
+    assert decode(codecs.BOM_UTF16_LE + text.encode("utf-16-le")) == text
+    assert decode(codecs.BOM_UTF16_BE + text.encode("utf-16-be")) == text
+    # The UTF-32-LE BOM starts with the UTF-16-LE one
+    assert decode(codecs.BOM_UTF32_LE + text.encode("utf-32-le")) == text
+
+    # UTF-8 without a BOM
+    assert decode(text.encode("utf-8")) == text
+
+    # Anything else is left to charset_normalizer
+    for sample, encoding in [
+        ("Привет, мир! Это простой текст в кодировке Windows.", "cp1251"),
+        ("こんにちは、世界。これは日本語のテキストです。", "shift_jis"),
+    ]:
+        data = sample.encode(encoding)
+        with pytest.raises(UnicodeDecodeError):
+            data.decode("utf-8")
+        assert decode(data) == sample
+
+
+def test_markdownify_options() -> None:
+    markitdown = MarkItDown()
+    html = b"<h1>Title</h1><p><a href='https://example.com'>link</a></p>"
+    html_stream_info = StreamInfo(extension=".html")
+
+    result = markitdown.convert_stream(io.BytesIO(html), stream_info=html_stream_info)
+    assert "# Title" in result.markdown
+    assert "[link](https://example.com)" in result.markdown
+
+    # Markdownify options apply to the conversion they are passed to...
+    result = markitdown.convert_stream(
+        io.BytesIO(html), stream_info=html_stream_info, strip=["a"]
+    )
+    assert "[link]" not in result.markdown
+    assert "link" in result.markdown
+
+    # ...and do not leak into later ones
+    result = markitdown.convert_stream(io.BytesIO(html), stream_info=html_stream_info)
+    assert "[link](https://example.com)" in result.markdown
+
+
+@pytest.mark.parametrize(
+    "href",
+    [
+        "#section",
+        "#with space",
+        "#a(b)",
+        "#already%20escaped",
+        "/",
+        "/path/to/page",
+        "/path with space",
+        "/wiki/Foo_(bar)",
+        "/~user/file.name-1_2",
+        "/already%20escaped",
+        "/caf%C3%A9",
+        "/a%2Fb",
+        "/a/b.html#frag",
+        "//cdn.example.com/x",
+        "page.html",
+        "https://example.com/a b",
+        "https://example.com/wiki/Foo_(bar)",
+        "https://example.com/%7Euser/?q=a b#c d",
+        "javascript:alert(1)",
+        "mailto:someone@example.com",
+    ],
+)
+def test_markdownify_href_escaping(href) -> None:
+    """Test that the href escaping fast path agrees with the full escaping."""
+    html = '<p><a href="%s">link</a></p>' % href.replace('"', "&quot;")
+
+    def convert():
+        return MarkItDown().convert_stream(
+            io.BytesIO(html.encode("utf-8")), stream_info=StreamInfo(extension=".html")
+        )
+
+    # The full escaping, with the fast path disabled
+    with patch.object(markdownify_module, "_ESCAPED_HREF_RE", re.compile(r"(?!)")):
+        expected = convert().markdown
+    assert convert().markdown == expected
+
+
+def test_bing_serp_redirects() -> None:
+    target_url = "https://example.com/a?b=~~>"
+    encoded_url = base64.urlsafe_b64encode(target_url.encode("utf-8")).decode("ascii")
+    assert "-" in encoded_url  # Exercises the URL-safe alphabet
+    undecodable_href = "https://www.bing.com/ck/a?u=a1" + base64.urlsafe_b64encode(
+        b"\xff\xfe"
+    ).decode("ascii")
+
+    html = f"""<html><head><title>Bing</title></head><body>
+<li class="b_algo"><h2><a href="https://www.bing.com/ck/a?!&&p=abc&u=a1{encoded_url.rstrip("=")}&ntb=1">Redirected</a></h2>
+<span class="algoSlug_icon">icon</span><p>First <span class="tptt">result</span>text</p></li>
+<li class="b_algo"><h2><a href="https://example.org/direct">Direct</a></h2></li>
+<li class="b_algo"><h2><a href="{undecodable_href}">Undecodable</a></h2></li>
+</body></html>"""
+
+    result = MarkItDown().convert_stream(
+        io.BytesIO(html.encode("utf-8")),
+        stream_info=StreamInfo(
+            extension=".html", url="https://www.bing.com/search?q=markitdown"
+        ),
+    )
+    assert result.markdown.startswith(
+        "## A Bing search for 'markitdown' found the following results:"
+    )
+    assert f"[Redirected]({target_url})" in result.markdown
+    assert "[Direct](https://example.org/direct)" in result.markdown
+    assert f"[Undecodable]({undecodable_href})" in result.markdown
+    assert "First result text" in result.markdown
+    assert "icon" not in result.markdown
+
+
+def test_rss_namespaces() -> None:
+    """Test how feed elements are matched through namespace prefixes."""
+    atom_ns = "http://www.w3.org/2005/Atom"
+    xml_stream_info = StreamInfo(extension=".xml")
+    converter = RssConverter()
+
+    def convert_feed(xml):
+        stream = io.BytesIO(xml.encode("utf-8"))
+        assert converter.accepts(stream, xml_stream_info)
+        assert stream.tell() == 0
+        return converter.convert(stream, xml_stream_info).markdown
+
+    # Atom elements match through the default namespace, or any prefix bound to it
+    markdown = convert_feed(
+        f"""<?xml version="1.0"?>
+<feed xmlns="{atom_ns}" xmlns:atom="{atom_ns}">
+  <title>Feed title</title>
+  <atom:entry><atom:title>Prefixed entry</atom:title><atom:updated>2024-01-01</atom:updated></atom:entry>
+  <entry><title>Plain entry</title><summary>Some &lt;b&gt;bold&lt;/b&gt; text</summary></entry>
+</feed>"""
+    )
+    assert markdown == (
+        "# Feed title\n"
+        "\n## Prefixed entry\nUpdated on: 2024-01-01\n"
+        "\n## Plain entry\nSome **bold** text"
+    )
+
+    # RSS in a default namespace, with prefixed content:encoded
+    markdown = convert_feed(
+        """<?xml version="1.0"?>
+<rss version="2.0" xmlns="http://example.com/rss" xmlns:content="http://purl.org/rss/1.0/modules/content/">
+  <channel>
+    <title>Channel</title><description>About</description>
+    <item>
+      <title>Item one</title><pubDate>Mon, 01 Jan 2024</pubDate>
+      <content:encoded>&lt;p&gt;Encoded &lt;i&gt;content&lt;/i&gt;&lt;/p&gt;</content:encoded>
+    </item>
+  </channel>
+</rss>"""
+    )
+    assert markdown == (
+        "# Channel\nAbout\n"
+        "\n## Item one\nPublished on: Mon, 01 Jan 2024\nEncoded *content*"
+    )
+
+    # Names are qualified as written, so a feed without a default namespace
+    # whose root is <atom:feed> is not claimed
+    stream = io.BytesIO(
+        f"""<?xml version="1.0"?>
+<atom:feed xmlns:atom="{atom_ns}">
+  <atom:title>Feed title</atom:title>
+  <atom:entry><atom:title>Entry</atom:title></atom:entry>
+</atom:feed>""".encode(
+            "utf-8"
+        )
+    )
+    assert not converter.accepts(stream, xml_stream_info)
+    assert stream.tell() == 0
+
+    # Malformed XML is not claimed, and fails to convert
+    malformed = b'<?xml version="1.0"?><rss><channel><title>Broken</title></channel>'
+    stream = io.BytesIO(malformed)
+    assert not converter.accepts(stream, xml_stream_info)
+    assert stream.tell() == 0
+    with pytest.raises(ParseError):
+        converter.convert(io.BytesIO(malformed), StreamInfo(extension=".rss"))
+
+
+def test_youtube_find_key() -> None:
+    converter = YouTubeConverter()
+    data = {
+        "header": {"title": "x"},
+        "contents": [{"description": {}}, {"description": {"content": "Hello"}}],
+    }
+    assert converter._findKey(data, "description") == {"content": "Hello"}
+    assert converter._findKey(data, "missing") is None
+
+    # Deep nesting must not hit the recursion limit
+    for _ in range(5000):
+        data = {"contents": [data]}
+    assert converter._findKey(data, "description") == {"content": "Hello"}
+
+    # Descriptions are read from ytInitialData with or without a full parse
+    for description in (
+        {"content": 'Line 1\nLine "2" \u00e9'},
+        {"commandRuns": [], "content": 'Line 1\nLine "2" \u00e9'},
+    ):
+        script = "var ytInitialData = %s;" % json.dumps(
+            {"header": {}, "attributedDescriptionBodyText": description}
+        )
+        match = re.search(r"var ytInitialData = ({.*?});", script)
+        assert match is not None
+        assert converter._extract_description(match) == 'Line 1\nLine "2" \u00e9'
+
+
 @pytest.mark.skipif(
     skip_exiftool,
     reason="do not run if exiftool is not installed",
@@ -462,6 +877,45 @@ def test_markitdown_exiftool() -> None:
         assert target in result.text_content
 
 
+def test_image_signatures() -> None:
+    """Test that images are recognized by their content, not their labels."""
+    png_bytes = base64.b64decode(
+        "iVBORw0KGgoAAAANSUhEUgAAAAEAAAABCAYAAAAfFcSJAAAADUlEQVR42mNk+M9QDwADhgGAWjR9awAAAABJRU5ErkJggg=="
+    )
+    mock_client = MagicMock()
+    mock_client.chat.completions.create.return_value = MagicMock(
+        choices=[MagicMock(message=MagicMock(content="A tiny image 0d4b8e"))]
+    )
+    markitdown = MarkItDown(llm_client=mock_client, llm_model="gpt-4o")
+
+    # A PNG with no extension or mimetype hint
+    result = markitdown.convert_stream(io.BytesIO(png_bytes))
+    assert "A tiny image 0d4b8e" in result.markdown
+    assert mock_client.chat.completions.create.call_count == 1
+
+    # A .jpg that is not a JPEG is left to the other converters
+    result = markitdown.convert_stream(
+        io.BytesIO(b"This is plainly not a JPEG."),
+        stream_info=StreamInfo(extension=".jpg"),
+    )
+    assert result.markdown == "This is plainly not a JPEG."
+    assert mock_client.chat.completions.create.call_count == 1
+
+    # The check reads the header without moving the stream
+    converter = ImageConverter()
+    for data, stream_info, expected in [
+        (png_bytes, StreamInfo(mimetype="image/png"), True),
+        (png_bytes, StreamInfo(extension=".jpg"), True),
+        (b"\xff\xd8\xff\xe0 JPEG", StreamInfo(extension=".jpeg"), True),
+        (b"\xff\xd8", StreamInfo(extension=".jpg"), False),  # Truncated header
+        (b"GIF89a", StreamInfo(mimetype="image/png"), False),
+        (png_bytes, StreamInfo(extension=".gif"), False),
+    ]:
+        stream = io.BytesIO(data)
+        assert converter.accepts(stream, stream_info) is expected
+        assert stream.tell() == 0
+
+
 def test_markitdown_llm_parameters() -> None:
     """Test that LLM parameters are correctly passed to the client."""
     mock_client = MagicMock()
@@ -506,6 +960,78 @@ def test_markitdown_llm_parameters() -> None:
     assert messages[0]["content"][0]["text"] == test_prompt
 
 
+def test_llm_caption_cache() -> None:
+    """Test that repeated images are only captioned once per client and prompt."""
+    mock_client = MagicMock()
+    mock_client.chat.completions.create.return_value = MagicMock(
+        choices=[MagicMock(message=MagicMock(content="A cached caption 29f4c1"))]
+    )
+    markitdown = MarkItDown(llm_client=mock_client, llm_model="gpt-4o")
+
+    for _ in range(2):
+        result = markitdown.convert(os.path.join(TEST_FILES_DIR, "test_llm.jpg"))
+        assert "A cached caption 29f4c1" in result.markdown
+    assert mock_client.chat.completions.create.call_count == 1
+
+    # A different prompt is a different caption
+    markitdown.convert(
+        os.path.join(TEST_FILES_DIR, "test_llm.jpg"), llm_prompt="Another prompt."
+    )
+    assert mock_client.chat.completions.create.call_count == 2
+
+
+def test_llm_caption_failures() -> None:
+    """Test that failed captions are retried, and that clients are not pinned."""
+    response = MagicMock(
+        choices=[MagicMock(message=MagicMock(content="A retried caption 7e01b3"))]
+    )
+    image_stream = io.BytesIO(b"not really an image")
+    image_stream_info = StreamInfo(mimetype="image/jpeg", extension=".jpg")
+
+    # Neither errors nor interrupts are cached, and neither leaves later calls waiting
+    for error in (RuntimeError("API error"), KeyboardInterrupt()):
+        mock_client = MagicMock()
+        mock_client.chat.completions.create.side_effect = [error, response]
+        with pytest.raises(type(error)):
+            llm_caption(image_stream, image_stream_info, client=mock_client, model="m")
+        for _ in range(2):
+            caption = llm_caption(
+                image_stream, image_stream_info, client=mock_client, model="m"
+            )
+            assert caption == "A retried caption 7e01b3"
+        assert mock_client.chat.completions.create.call_count == 2
+
+    # The cache does not keep clients alive
+    mock_client = MagicMock()
+    mock_client.chat.completions.create.return_value = MagicMock(
+        choices=[MagicMock(message=MagicMock(content="A weak caption 3c9a52"))]
+    )
+    caption = llm_caption(
+        image_stream, image_stream_info, client=mock_client, model="m"
+    )
+    assert caption == "A weak caption 3c9a52"
+    client_ref = weakref.ref(mock_client)
+    del mock_client
+    gc.collect()
+    assert client_ref() is None
+
+    # Unhashable clients still work, just without caching
+    class UnhashableClient:
+        __hash__ = None  # type: ignore[assignment]
+
+        def __init__(self):
+            self.chat = MagicMock()
+            self.chat.completions.create.return_value = response
+
+    unhashable_client = UnhashableClient()
+    for _ in range(2):
+        caption = llm_caption(
+            image_stream, image_stream_info, client=unhashable_client, model="m"
+        )
+        assert caption == "A retried caption 7e01b3"
+    assert unhashable_client.chat.completions.create.call_count == 2
+
+
 @pytest.mark.skipif(
     skip_llm,
     reason="do not run llm tests without a key",
@@ -542,10 +1068,23 @@ if __name__ == "__main__":
         test_input_as_strings,
         test_markitdown_remote,
         test_speech_transcription,
+        test_transcription_backends,
         test_exceptions,
+        test_pdf_backend,
+        test_converter_kwargs,
+        test_non_seekable_stream,
+        test_zip_members,
+        test_plain_text_decoding,
+        test_markdownify_options,
+        test_bing_serp_redirects,
+        test_rss_namespaces,
+        test_youtube_find_key,
         test_doc_rlink,
         test_markitdown_exiftool,
+        test_image_signatures,
         test_markitdown_llm_parameters,
+        test_llm_caption_cache,
+        test_llm_caption_failures,
         test_markitdown_llm,
     ]:
         print(f"Running {test.__name__}...", end="")